@@ -4,19 +4,464 @@ FalkorDB CSV Loader
 
 Loads nodes and edges from CSV files in the 'csv_output' folder into FalkorDB.
 Uses the falkordb-py library with batch processing and proper error handling.
+If pyarrow (or, failing that, polars) is installed, CSV files are parsed and typed
+column-wise by it.
+If hiredis is installed, redis-py uses it to parse server replies.
 """
 
 import os
+import re
 import csv
+import copy
+import functools
+import heapq
+import itertools
+import math
+import multiprocessing
+import struct
+import tempfile
 import argparse
+import asyncio
 import sys
-from datetime import datetime
-from typing import Dict, List, Any
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from operator import methodcaller
+from typing import Dict, List, Any, Iterator, Tuple
 from falkordb import FalkorDB
+from falkordb.helpers import quote_string, stringify_param_value
+
+try:
+    # Optional: columnar CSV parsing in C++ (pip install pyarrow)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
+    pc = None
+    pv = None
+
+try:
+    # Optional: multi-threaded CSV parsing in Rust, used when pyarrow is missing (pip install polars)
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    # Optional: renders UNWIND batch parameters in C (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Numeric literal patterns for CSV cell type inference (matched in C, no temporary strings)
+_INT_RE = re.compile(r'-?[0-9]+')
+_FLOAT_RE = re.compile(r'-?(?:[0-9]+\.[0-9]*|\.[0-9]+)')
+# The same patterns over a whole newline-joined column, so a column is classified in one scan
+_INT_COLUMN_RE = re.compile(r'-?[0-9]+(?:\n-?[0-9]+)*')
+_FLOAT_COLUMN_RE = re.compile(r'-?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:\n-?(?:[0-9]+\.[0-9]*|\.[0-9]+))*')
+_NUMBER_LINE_RE = re.compile(r'^-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)$', re.MULTILINE)
+# Anchored _INT_RE/_FLOAT_RE for the Arrow and Polars regex kernels
+_INT_PATTERN = '^' + _INT_RE.pattern + '$'
+_FLOAT_PATTERN = '^' + _FLOAT_RE.pattern + '$'
+
+
+# (epoch second, formatted time) of the last log timestamp
+_last_timestamp = (None, '')
+
+
+def _timestamp() -> str:
+    """Wall-clock time for log lines, formatted at most once per second"""
+    global _last_timestamp
+    second = int(time.time())
+    cached = _last_timestamp
+    if cached[0] != second:
+        cached = _last_timestamp = (second, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second)))
+    return cached[1]
+
+
+def _elapsed(start: float) -> timedelta:
+    """Duration since a time.perf_counter() sample, printed like the wall-clock differences it replaces"""
+    return timedelta(seconds=time.perf_counter() - start)
+
+
+def _coerce(value: str) -> Any:
+    """Convert a raw CSV cell to int/float/str, mapping empty cells to None"""
+    if not value:
+        return None
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return value
+
+
+# Edge CSV columns that describe the relationship itself rather than its properties
+_EDGE_META_COLUMNS = frozenset(('source', 'target', 'type', 'source_label', 'target_label'))
+
+
+def _clean_property_key(key: str) -> str:
+    """Remove duplicate prefixes from a property header, e.g. 'Date:Date' -> 'Date'"""
+    name, sep, rest = key.partition(':')
+    return name if sep and rest == name else key
+
+
+@functools.lru_cache(maxsize=256)
+def _first_label(value: Any) -> str:
+    """Return the first label of a CSV label cell (e.g., "OS:Process" -> "OS"); memoized per distinct value"""
+    return str(value or '').strip().split(':')[0]
+
+
+def _coerce_column(values: List[str]) -> List[Any]:
+    """Type a column of raw CSV cells like _coerce, classifying the whole column with one regex scan"""
+    present = [value for value in values if value]
+    if not present:
+        return [None] * len(values)
+    text = '\n'.join(present)
+    if text.count('\n') != len(present) - 1:
+        # Multi-line cells would confuse the line-based column patterns
+        return [_coerce(value) for value in values]
+    if _INT_COLUMN_RE.fullmatch(text):
+        convert = int
+    elif _FLOAT_COLUMN_RE.fullmatch(text):
+        convert = float
+    elif not _NUMBER_LINE_RE.search(text):
+        # No numeric cell at all: plain strings
+        return [value or None for value in values]
+    else:
+        # Mixed column: fall back to typing each cell
+        return [_coerce(value) for value in values]
+    return [convert(value) if value else None for value in values]
+
+
+def _narrow_kind(present: int, count_matching) -> str:
+    """Classify a string column the way _coerce_column types it, from count_matching(pattern) of its cells
+    
+    Returns 'int' or 'float' when every non-empty cell is that literal, 'str' when no cell is numeric
+    and 'mixed' when the cells have to be typed one by one.
+    """
+    if not present:
+        return 'str'
+    ints = count_matching(_INT_PATTERN)
+    if ints == present:
+        return 'int'
+    floats = count_matching(_FLOAT_PATTERN)
+    if floats == present:
+        return 'float'
+    return 'mixed' if ints or floats else 'str'
+
+
+def _narrow_column(column):
+    """Type an all-string Arrow column like _coerce_column: one cast for uniform columns, else a list typed per cell"""
+    kind = _narrow_kind(len(column) - column.null_count,
+                        lambda pattern: pc.sum(pc.match_substring_regex(column, pattern)).as_py() or 0)
+    if kind == 'str':
+        return column
+    if kind != 'mixed':
+        try:
+            return column.cast(pa.int64() if kind == 'int' else pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass  # e.g. integers beyond int64, which Python keeps exact
+    return _coerce_column(column.to_pylist())
+
+
+def _narrow_series(series):
+    """Type an all-string Polars column like _coerce_column: one cast for uniform columns, else a list typed per cell"""
+    kind = _narrow_kind(len(series) - series.null_count(), lambda pattern: series.str.contains(pattern).sum())
+    if kind == 'str':
+        return series
+    if kind != 'mixed':
+        try:
+            return series.cast(pl.Int64 if kind == 'int' else pl.Float64, strict=True)
+        except pl.exceptions.PolarsError:
+            pass  # e.g. integers beyond Int64, which Python keeps exact
+    return _coerce_column(series.to_list())
+
+
+def _ragged_block(rows: List[str], width: int) -> Iterator[Tuple[list, int]]:
+    """Yield the rows Arrow skipped for a wrong column count as one block, padded or cut to width like the stdlib path"""
+    if not rows:
+        return
+    parsed = [row + [''] * (width - len(row)) for row in csv.reader(rows) if row]
+    yield [_coerce_column([row[index] for row in parsed]) for index in range(width)], len(parsed)
+
+
+def _polars_blocks(reader) -> Iterator[Tuple[list, int]]:
+    """Yield (narrowed columns, row count) for each DataFrame of a Polars batched CSV reader"""
+    while True:
+        frames = reader.next_batches(4)
+        if not frames:
+            return
+        for frame in frames:
+            yield [_narrow_series(series) for series in frame.get_columns()], frame.height
+
+
+# How often the writer checks that parse workers are still alive while their queue is empty
+_PARSE_POLL_SECONDS = 1.0
+
+
+def _warm_page_cache(path: str):
+    """Have the kernel read a file into the page cache ahead of parsing, without keeping a copy in Python"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # iter_csv_batches opens the file and reports the error
+        return
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            # No readahead hint on this platform: read through the file and drop the data
+            while os.read(fd, 1 << 20):
+                pass
+    finally:
+        os.close(fd)
+
+
+# CSV files up to this size are opened during discovery to check for rows past the header
+_SMALL_CSV_BYTES = 256
+
+
+def _csv_has_rows(entry: os.DirEntry) -> bool:
+    """False for empty or header-only CSV files; only files of a few hundred bytes are read"""
+    size = entry.stat().st_size
+    if size > _SMALL_CSV_BYTES:
+        return True
+    if size == 0:
+        return False
+    with open(entry.path, 'rb') as f:
+        # Blank lines are skipped by the parsers, so only a line break between content counts
+        return b'\n' in f.read().strip()
+
+
+# Edge rows sorted in memory per spilled run by --presort-edges
+_SORT_RUN_ROWS = 200_000
+# Spilled runs open at once while merging; more runs are merged in passes to stay under the open-file limit
+_SORT_MERGE_RUNS = 64
+
+
+def _edge_sort_key(value: str) -> Tuple[int, Any]:
+    """Order raw id cells as the loader types them: integers numerically, then anything else as text"""
+    if _INT_RE.fullmatch(value):
+        return (0, int(value))
+    return (1, value)
+
+
+def _merge_sorted_runs(run_paths: List[str], out_path: str, key, rows: List[List[str]] = (), header: List[str] = None):
+    """Merge sorted CSV runs and then rows into out_path and delete the runs; equal keys keep that order, as with sorted()"""
+    run_files = []
+    try:
+        for run_path in run_paths:
+            run_files.append(open(run_path, 'r', encoding='utf-8', newline=''))
+        with open(out_path, 'w', encoding='utf-8', newline='') as out_file:
+            writer = csv.writer(out_file)
+            if header is not None:
+                writer.writerow(header)
+            writer.writerows(heapq.merge(*(csv.reader(run_file) for run_file in run_files), rows, key=key))
+    finally:
+        for run_file in run_files:
+            run_file.close()
+        for run_path in run_paths:
+            os.remove(run_path)
+
+
+# Column buffers each concurrent parser may leave in a loader's BatchPool
+_POOL_COLUMNS_PER_PARSER = 64
+
+
+class BatchPool:
+    """Bounded free list of batch column buffers, shared by every file (and thread) one loader parses"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._free: List[List[Any]] = []
+
+    def get(self, count: int, size: int) -> List[List[Any]]:
+        """Take count column buffers of length size, allocating only when the free list runs dry"""
+        columns = []
+        for _ in range(count):
+            try:
+                column = self._free.pop()
+            except IndexError:
+                column = [None] * size
+            else:
+                # The last batch of a file truncates its columns; restore the batch length
+                if len(column) < size:
+                    column.extend([None] * (size - len(column)))
+                else:
+                    del column[size:]
+            columns.append(column)
+        return columns
+
+    def put(self, columns: List[List[Any]]):
+        """Hand column buffers back for the next file, keeping at most limit of them"""
+        for column in columns:
+            if len(self._free) >= self.limit:
+                break
+            self._free.append(column)
+
+
+def _set_clause(var: str, names, first_index: int, keep_existing: bool = False) -> str:
+    """Build 'var.`name` = row[i], ...' assignments for positional UNWIND rows"""
+    assignments = []
+    for index, name in enumerate(names, first_index):
+        value = f"row[{index}]"
+        if keep_existing:
+            # Null cells must not erase a property that is already set
+            value = f"coalesce({value}, {var}.`{name}`)"
+        assignments.append(f"{var}.`{name}` = {value}")
+    return ', '.join(assignments)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_node_cypher(label: str, prop_keys: Tuple[str, ...], merge: bool) -> str:
+    """Build the UNWIND query for a node file, setting each CSV column explicitly"""
+    if merge:
+        # Null cells keep the existing value of a merged node
+        set_clause = _set_clause('n', prop_keys, 1, keep_existing=True)
+        return f"UNWIND $batch AS row MERGE (n:{label} {{id: row[0]}}){' SET ' + set_clause if set_clause else ''}"
+    # Setting a property to null on a new node is a no-op
+    set_clause = _set_clause('n', ('id',) + prop_keys, 0)
+    return f"UNWIND $batch AS row CREATE (n:{label}) SET {set_clause}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_edge_cypher(rel_type: str, source_label: str, target_label: str, prop_names: Tuple[str, ...], merge: bool) -> str:
+    """Build the UNWIND query for a relationship type and endpoint labels"""
+    # Use label matching if available
+    if source_label and target_label:
+        source, target = f"a:{source_label}", f"b:{target_label}"
+    else:
+        source, target = 'a', 'b'
+    
+    if merge:
+        # Null cells keep the existing value of a merged relationship
+        set_clause = _set_clause('r', prop_names, 2, keep_existing=True)
+        query = (
+            f"UNWIND $batch AS row "
+            f"MERGE ({source} {{id: row[0]}}) "
+            f"MERGE ({target} {{id: row[1]}}) "
+            f"MERGE (a)-[r:{rel_type}]->(b)"
+        )
+    else:
+        set_clause = _set_clause('r', prop_names, 2)
+        query = (
+            f"UNWIND $batch AS row "
+            f"MATCH ({source} {{id: row[0]}}) "
+            f"MATCH ({target} {{id: row[1]}}) "
+            f"CREATE (a)-[r:{rel_type}]->(b)"
+        )
+    if set_clause:
+        query += f" SET {set_clause}"
+    return query
+
+
+def _float_literal(value: float) -> str:
+    """Render a float like str(), except that NaN and infinities become null as orjson renders them"""
+    return str(value) if math.isfinite(value) else 'null'
+
+
+# Cypher literal encoders for the cell types the CSV parsers produce; anything else goes through falkordb-py
+_CELL_ENCODERS = {type(None): lambda value: 'null', int: str, float: _float_literal, str: quote_string}
+
+
+def _encode_column(values: Tuple[Any, ...]) -> List[str]:
+    """Render one batch column as Cypher literals, picking the encoder once per column unless its cell types mix"""
+    kinds = set(map(type, values))
+    if len(kinds) == 1:
+        return list(map(_CELL_ENCODERS.get(kinds.pop(), stringify_param_value), values))
+    kinds.discard(type(None))
+    if len(kinds) == 1:
+        encode = _CELL_ENCODERS.get(kinds.pop(), stringify_param_value)
+        return ['null' if value is None else encode(value) for value in values]
+    return [_CELL_ENCODERS.get(type(value), stringify_param_value)(value) for value in values]
+
+
+def _batch_params_header(batch_data: List[Tuple[Any, ...]]) -> str:
+    """Build the CYPHER header for {'batch': batch_data}: orjson when installed, else column by column as graph.query() would"""
+    if orjson is not None:
+        # JSON arrays, strings, numbers and null are also Cypher literals. Batches with a string
+        # that needs escaping (or a value JSON can't hold) keep the encoder below, whose quoting
+        # matches falkordb-py's. NaN and infinities become null on both paths (the property is
+        # not set), since the server has no literal for them
+        try:
+            payload = orjson.dumps(batch_data)
+        except TypeError:
+            payload = b'\\'
+        if b'\\' not in payload:
+            return "CYPHER `batch`=" + payload.decode() + " "
+    if not batch_data:
+        return "CYPHER `batch`=[] "
+    columns = [_encode_column(column) for column in zip(*batch_data)]
+    return "CYPHER `batch`=[[" + "],[".join(map(','.join, zip(*columns))) + "]] "
+
+
+# Value encodings of FalkorDB's GRAPH.BULK binary protocol (same as falkordb-bulk-loader)
+_BULK_NULL = b'\x00'
+_BULK_BOOL = struct.Struct('=B?')
+_BULK_DOUBLE = struct.Struct('=Bd')
+_BULK_STRING = b'\x03'
+_BULK_LONG = struct.Struct('=Bq')
+_BULK_EDGE = struct.Struct('=QQ')
+
+
+def _pack_bulk_header(name: str, prop_names: List[str]) -> bytes:
+    """Pack a GRAPH.BULK label/relationship header: name, property count, property names"""
+    encoded = [name.encode()] + [prop.encode() for prop in prop_names]
+    fmt = '=%dsI' % (len(encoded[0]) + 1) + ''.join('%ds' % (len(prop) + 1) for prop in encoded[1:])
+    return struct.pack(fmt, encoded[0], len(prop_names), *encoded[1:])
+
+
+def _pack_bulk_value(value: Any) -> bytes:
+    """Pack a typed property value as a GRAPH.BULK type-prefixed binary value"""
+    if value is None:
+        return _BULK_NULL
+    if isinstance(value, bool):
+        return _BULK_BOOL.pack(1, value)
+    if isinstance(value, int):
+        return _BULK_LONG.pack(4, value)
+    if isinstance(value, float):
+        return _BULK_DOUBLE.pack(2, value)
+    return _BULK_STRING + str(value).encode() + b'\x00'
+
+
+def _parse_worker(parser: 'FalkorDBCSVLoader', prepare_method: str, file_paths: List[str], batch_size: int, batches, worker_id: int):
+    """Parse CSV files in a worker process or thread, queueing (file, query, rows) batches for the writer"""
+    try:
+        for file_path in parser._prefetched(file_paths):
+            # A None query marks the end of a file, with the error that cut it short (if any) in place of rows
+            error = None
+            try:
+                for query, batch_data in getattr(parser, prepare_method)(file_path, batch_size):
+                    batches.put((file_path, query, batch_data))
+            except Exception as e:
+                error = str(e)
+            batches.put((file_path, None, error))
+    except Exception as e:
+        print(f"❌ Error in parse worker: {e}")
+    finally:
+        # The worker's id marks the end of its partition
+        batches.put(worker_id)
+
+
+def _load_tenant(task: Tuple['FalkorDBCSVLoader', str, str, str, int]) -> Tuple[str, timedelta, str]:
+    """Load one tenant directory into its own graph in a pool process; returns (tenant, duration, error)"""
+    loader, tenant_name, tenant_path, graph_name, batch_size = task
+    start = time.perf_counter()
+    try:
+        # Redis connections can't cross process boundaries, so each tenant connects on its own
+        loader.db = FalkorDB(**loader._connection_kwargs)
+        loader._load_one_graph(tenant_path, loader.db.select_graph(graph_name), batch_size)
+        error = None
+    except Exception as e:
+        error = str(e)
+    return tenant_name, _elapsed(start), error
 
 
 class FalkorDBCSVLoader:
-    def __init__(self, host: str = "localhost", port: int = 6379, graph_name: str = "graph", csv_dir: str = "csv_output", username: str = None, password: str = None, merge_mode: bool = False, multi_graph_mode: bool = False):
+    def __init__(self, host: str = "localhost", port: int = 6379, graph_name: str = "graph", csv_dir: str = "csv_output", username: str = None, password: str = None, merge_mode: bool = False, multi_graph_mode: bool = False, debug: bool = False, loader_threads: int = 1, bulk_mode: bool = False, parse_workers: int = 0, unix_socket: str = None, prefetch: bool = False, quiet: bool = False, parallel_tenants: int = 0, parse_threads: int = 0, defer_indexes: bool = True, pipeline_depth: int = 1, parallel_edges: int = 0, async_tenants: bool = False, assume_unique: bool = False, presort_edges: bool = False):
         """
         Initialize FalkorDB connection
         
@@ -27,24 +472,70 @@ class FalkorDBCSVLoader:
         :param username: FalkorDB username (optional)
         :param password: FalkorDB password (optional)
         :param merge_mode: If True, use MERGE instead of CREATE for upsert behavior
+        :param assume_unique: If True with merge_mode, trust the node CSVs to hold no duplicate or existing ids and CREATE nodes (edges still MERGE)
         :param multi_graph_mode: If True, load each tenant subfolder into separate graphs
+        :param debug: If True, print sample records and generated queries for each file
+        :param loader_threads: Number of worker threads (sharing one connection pool) used to load CSV files concurrently
+        :param bulk_mode: If True, load new graphs with the binary GRAPH.BULK protocol (CREATE mode only)
+        :param parse_workers: Number of processes parsing CSV files for a single writer connection (0 disables)
+        :param unix_socket: Path of the server's UNIX socket; used instead of host/port when set (local servers only)
+        :param prefetch: If True, read the next CSV file into the page cache on a background thread while the current one is parsed
+        :param quiet: If True, skip per-batch timing and progress lines (per-file summaries are still printed)
+        :param parse_threads: Number of threads parsing CSV files ahead of a single submitting thread (0 disables; parse_workers takes precedence)
+        :param defer_indexes: If True, build indexes and constraints after loading, keeping only those MERGE/edge lookups need up front
+        :param pipeline_depth: Number of UNWIND batches sent per pipelined round trip (1 sends each batch on its own)
+        :param parallel_edges: If > 1, split each edge file into this many bins by source id and load the bins concurrently (edges then ignore parse_workers, parse_threads and loader_threads)
+        :param presort_edges: If True, externally sort each edge file by (source, target) id before loading it (files are then loaded one at a time)
+        :param parallel_tenants: Number of tenants loaded concurrently in multi-graph mode, one process each (0 = min(8, tenants))
+        :param async_tenants: If True, run concurrent tenants on one event loop with worker threads sharing the connection pool instead of processes
         """
         self.host = host
         self.port = port
         self.graph_name = graph_name
         self.csv_dir = csv_dir
         self.merge_mode = merge_mode
+        self.assume_unique = assume_unique
+        # Whether node files are upserted; --assume-unique skips the per-row id lookup MERGE needs
+        self.merge_nodes = merge_mode and not assume_unique
         self.multi_graph_mode = multi_graph_mode
+        self.debug = debug
+        self.loader_threads = max(1, loader_threads)
+        self.bulk_mode = bulk_mode
+        self.parse_workers = max(0, parse_workers)
+        self.parse_threads = max(0, parse_threads)
+        self.prefetch = prefetch
+        self.quiet = quiet
+        self.parallel_tenants = max(0, parallel_tenants)
+        self.async_tenants = async_tenants
+        self.defer_indexes = defer_indexes
+        self.pipeline_depth = max(1, pipeline_depth)
+        self.parallel_edges = max(0, parallel_edges)
+        self.presort_edges = presort_edges
+        # (query, rows, entity, source file, loaded counts, progress label, start time) awaiting a pipelined flush
+        self._pending_batches: List[Tuple[Any, ...]] = []
+        # Directory -> (node paths, edge paths), shared by the schema steps and the load itself
+        self._csv_listings: Dict[str, Tuple[List[str], List[str]]] = {}
+        # Column buffers recycled across files; sized for every parser that can run at once
+        self._batch_pool = BatchPool(_POOL_COLUMNS_PER_PARSER * (max(self.loader_threads, self.parse_threads, self.parallel_edges) + 1))
+        # Keepalive stops idle pooled connections from being dropped during long loads;
+        # kept so tenant processes can open their own connection
+        self._connection_kwargs = {'username': username, 'password': password, 'socket_keepalive': True}
+        if unix_socket:
+            self._connection_kwargs['unix_socket_path'] = unix_socket
+        else:
+            self._connection_kwargs.update(host=host, port=port)
         
         try:
-            print(f"Connecting to FalkorDB at {host}:{port}...")
-            self.db = FalkorDB(host=host, port=port, username=username, password=password)
+            print(f"Connecting to FalkorDB at {unix_socket or f'{host}:{port}'}...")
+            self.db = FalkorDB(**self._connection_kwargs)
             
             if not multi_graph_mode:
                 self.graph = self.db.select_graph(graph_name)
                 print(f"✅ Connected to FalkorDB graph '{graph_name}'")
             else:
                 self.graph = None  # Will be set per tenant
+                # Names of the graphs a multi-graph load wrote to, for --stats
+                self.tenant_graphs: List[str] = []
                 print(f"✅ Connected to FalkorDB in multi-graph mode")
         except Exception as e:
             print(f"❌ Failed to connect to FalkorDB: {e}")
@@ -64,6 +555,141 @@ class FalkorDBCSVLoader:
             print(f"❌ Error reading {file_path}: {e}")
             return []
     
+    @staticmethod
+    def _truncate_columns(columns: Dict[str, List[Any]], count: int) -> Dict[str, List[Any]]:
+        """Cut preallocated batch columns down to the rows actually filled by the last batch"""
+        for column in columns.values():
+            del column[count:]
+        return columns
+    
+    @staticmethod
+    def _coerce_columns(columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """Type raw CSV string columns in place, one column at a time"""
+        for column in columns.values():
+            column[:] = _coerce_column(column)
+        return columns
+    
+    def iter_csv_batches(self, file_path: str, batch_size: int) -> Iterator[Dict[str, List[Any]]]:
+        """Stream CSV file as batches of typed columns: header name -> list of values (empty cells are None)
+        
+        The column lists come from the loader's BatchPool and are overwritten by the next batch
+        (or the next file), so consumers must copy what they keep before advancing the iterator.
+        """
+        total_rows = 0
+        buffers = None
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if header is None:
+                    return
+                
+                # Reused by every batch of this file (and by later files) instead of allocating fresh lists.
+                # Cells are filled by position; a repeated header name maps to its last column, as with csv.DictReader
+                buffers = self._batch_pool.get(len(header), batch_size)
+                columns = {name: buffers[index] for index, name in enumerate(header)}
+                count = 0
+                
+                if pv is None and pl is None:
+                    for raw_row in reader:
+                        if not raw_row:
+                            continue
+                        if len(raw_row) < len(header):
+                            # Short rows get empty values for the missing columns, as with csv.DictReader
+                            raw_row += [''] * (len(header) - len(raw_row))
+                        for column, value in zip(buffers, raw_row):
+                            column[count] = value
+                        count += 1
+                        if count == batch_size:
+                            total_rows += count
+                            yield self._coerce_columns(columns)
+                            count = 0
+                    if count:
+                        total_rows += count
+                        yield self._coerce_columns(self._truncate_columns(columns, count))
+                    return
+            
+            # Read every column as string so Arrow/Polars don't reformat dates/booleans,
+            # then narrow numeric columns in one vectorized cast per column
+            if pv is not None:
+                # Arrow skips rows with a different column count; they are padded like the stdlib path does
+                # and loaded after the rest of the file
+                ragged_rows = []
+                reader = pv.open_csv(
+                    file_path,
+                    read_options=pv.ReadOptions(block_size=16 << 20),
+                    parse_options=pv.ParseOptions(invalid_row_handler=lambda row: ragged_rows.append(row.text) or 'skip'),
+                    convert_options=pv.ConvertOptions(
+                        column_types={name: pa.string() for name in header},
+                        strings_can_be_null=True,
+                        null_values=[''],
+                    ),
+                )
+                blocks = itertools.chain(
+                    (([_narrow_column(array) for array in record_batch.columns], record_batch.num_rows) for record_batch in reader),
+                    _ragged_block(ragged_rows, len(header)),
+                )
+                to_list = methodcaller('to_pylist')
+            else:
+                # The batched reader only takes a path. Polars fills short rows with nulls; long rows are
+                # cut to the header width like the other parsers do
+                blocks = _polars_blocks(pl.read_csv_batched(file_path, batch_size=batch_size, infer_schema_length=0, truncate_ragged_lines=True))
+                to_list = methodcaller('to_list')
+            
+            for arrays, num_rows in blocks:
+                offset = 0
+                while offset < num_rows:
+                    # Only materialize Python objects for the rows of the current batch
+                    take = min(batch_size - count, num_rows - offset)
+                    for column, array in zip(buffers, arrays):
+                        column[count:count + take] = array[offset:offset + take] if type(array) is list else to_list(array.slice(offset, take))
+                    offset += take
+                    count += take
+                    if count == batch_size:
+                        total_rows += count
+                        yield columns
+                        count = 0
+            if count:
+                total_rows += count
+                yield self._truncate_columns(columns, count)
+        except Exception as e:
+            print(f"❌ Error reading {file_path}: {e}")
+        finally:
+            if buffers is not None:
+                self._batch_pool.put(buffers)
+            print(f"  Read {total_rows} rows from {file_path}")
+    
+    def _scan_csv_files(self, directory: str) -> Tuple[List[str], List[str]]:
+        """List the nodes_*.csv and edges_*.csv file paths of a directory, scanning it only once per loader"""
+        listing = self._csv_listings.get(directory)
+        if listing is not None:
+            return listing
+        node_paths, edge_paths = [], []
+        skipped_empty = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.csv'):
+                    continue
+                # Names are filtered before is_file(), which may need a stat call
+                if name.startswith('nodes_'):
+                    paths = node_paths
+                elif name.startswith('edges_'):
+                    paths = edge_paths
+                else:
+                    continue
+                if not entry.is_file():
+                    continue
+                # Files without data rows would only cost an open, a parse and a round trip
+                if _csv_has_rows(entry):
+                    paths.append(entry.path)
+                else:
+                    skipped_empty += 1
+        if skipped_empty:
+            print(f"⚠️ Skipped {skipped_empty} empty CSV files in {directory}")
+        listing = self._csv_listings[directory] = (node_paths, edge_paths)
+        return listing
+    
     def create_id_indexes_for_all_labels(self):
         """Create index on 'id' property for each node label found in CSV files"""
         if not os.path.exists(self.csv_dir):
@@ -72,31 +698,30 @@ class FalkorDBCSVLoader:
         print("🔧 Creating ID indexes for all node labels...")
         
         # Find all node CSV files to determine labels
-        csv_files = os.listdir(self.csv_dir)
-        node_files = [f for f in csv_files if f.startswith('nodes_') and f.endswith('.csv')]
+        node_paths, _ = self._scan_csv_files(self.csv_dir)
         
         created_count = 0
         
-        for node_file in node_files:
-            # Extract label from filename (preserve original case)
-            raw_label = node_file.replace('nodes_', '').replace('.csv', '')
-            # Sanitize label: replace colons and other invalid characters with underscores
-            label = raw_label.replace(':', '_')
-            
-            try:
-                # Create index on id property for this label
-                query = f"CREATE INDEX ON :{label}(id)"
-                print(f"  Creating ID index: {query}")
-                result = self.graph.query(query)
+        labels = []
+        queries = []
+        for node_path in node_paths:
+            label = self._node_label(node_path)
+            # Create index on id property for this label
+            query = f"CREATE INDEX ON :{label}(id)"
+            print(f"  Creating ID index: {query}")
+            labels.append(label)
+            queries.append(query)
+        
+        for label, reply in zip(labels, self._apply_schema(queries)):
+            if not isinstance(reply, Exception):
                 created_count += 1
-                
-            except Exception as e:
-                error_msg = str(e).lower()
-                if any(keyword in error_msg for keyword in ['already exists', 'equivalent', 'already indexed', 'index exists']):
-                    # Silently skip - index already exists, which is what we want
-                    pass
-                else:
-                    print(f"  ❌ Error creating ID index on {label}.id: {e}")
+                continue
+            error_msg = str(reply).lower()
+            if any(keyword in error_msg for keyword in ['already exists', 'equivalent', 'already indexed', 'index exists']):
+                # Silently skip - index already exists, which is what we want
+                pass
+            else:
+                print(f"  ❌ Error creating ID index on {label}.id: {reply}")
         
         if created_count > 0:
             print(f"✅ Created {created_count} ID indexes")
@@ -116,6 +741,8 @@ class FalkorDBCSVLoader:
         created_count = 0
         skipped_count = 0
         
+        targets = []
+        queries = []
         for index in indexes:
             labels = index.get('labels', '').strip()
             properties = index.get('properties', '').strip()
@@ -134,20 +761,22 @@ class FalkorDBCSVLoader:
             # Create index for each label-property combination
             for label in label_list:
                 for prop in prop_list:
-                    try:
-                        # Create regular index
-                        query = f"CREATE INDEX ON :{label}({prop})"
-                        print(f"  Creating: {query}")
-                        result = self.graph.query(query)
-                        created_count += 1
-                        
-                    except Exception as e:
-                        error_msg = str(e).lower()
-                        if any(keyword in error_msg for keyword in ['already exists', 'equivalent', 'already indexed', 'index exists']):
-                            # Silently skip - index already exists, which is what we want
-                            pass
-                        else:
-                            print(f"  ❌ Error creating index on {label}.{prop}: {e}")
+                    # Create regular index
+                    query = f"CREATE INDEX ON :{label}({prop})"
+                    print(f"  Creating: {query}")
+                    targets.append(f"{label}.{prop}")
+                    queries.append(query)
+        
+        for target, reply in zip(targets, self._apply_schema(queries)):
+            if not isinstance(reply, Exception):
+                created_count += 1
+                continue
+            error_msg = str(reply).lower()
+            if any(keyword in error_msg for keyword in ['already exists', 'equivalent', 'already indexed', 'index exists']):
+                # Silently skip - index already exists, which is what we want
+                pass
+            else:
+                print(f"  ❌ Error creating index on {target}: {reply}")
         
         print(f"✅ Created {created_count} indexes from CSV, skipped {skipped_count}")
     
@@ -165,6 +794,8 @@ class FalkorDBCSVLoader:
         
         created_count = 0
         
+        targets = []
+        queries = []
         for constraint in constraints:
             labels = constraint.get('labels', '').strip()
             properties = constraint.get('properties', '').strip()
@@ -180,25 +811,27 @@ class FalkorDBCSVLoader:
             
             # Create supporting index for each label
             for label in label_list:
-                try:
-                    # Create index with all properties required for the constraint
-                    if len(prop_list) == 1:
-                        query = f"CREATE INDEX FOR (n:{label}) ON (n.{prop_list[0]})"
-                    else:
-                        prop_str = ', '.join([f'n.{prop}' for prop in prop_list])
-                        query = f"CREATE INDEX FOR (n:{label}) ON ({prop_str})"
-                    
-                    print(f"  Creating supporting index: {query}")
-                    result = self.graph.query(query)
-                    created_count += 1
-                    
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if any(keyword in error_msg for keyword in ['already indexed', 'already exists', 'equivalent', 'index exists']):
-                        # Silently skip - supporting index already exists, which is what we want
-                        pass
-                    else:
-                        print(f"  ❌ Error creating supporting index for {label}({', '.join(prop_list)}): {e}")
+                # Create index with all properties required for the constraint
+                if len(prop_list) == 1:
+                    query = f"CREATE INDEX FOR (n:{label}) ON (n.{prop_list[0]})"
+                else:
+                    prop_str = ', '.join([f'n.{prop}' for prop in prop_list])
+                    query = f"CREATE INDEX FOR (n:{label}) ON ({prop_str})"
+                
+                print(f"  Creating supporting index: {query}")
+                targets.append(f"{label}({', '.join(prop_list)})")
+                queries.append(query)
+        
+        for target, reply in zip(targets, self._apply_schema(queries)):
+            if not isinstance(reply, Exception):
+                created_count += 1
+                continue
+            error_msg = str(reply).lower()
+            if any(keyword in error_msg for keyword in ['already indexed', 'already exists', 'equivalent', 'index exists']):
+                # Silently skip - supporting index already exists, which is what we want
+                pass
+            else:
+                print(f"  ❌ Error creating supporting index for {target}: {reply}")
         
         if created_count > 0:
             print(f"✅ Created {created_count} supporting indexes")
@@ -220,6 +853,8 @@ class FalkorDBCSVLoader:
         created_count = 0
         skipped_count = 0
         
+        targets = []
+        commands = []
         for constraint in constraints:
             labels = constraint.get('labels', '').strip()
             properties = constraint.get('properties', '').strip()
@@ -237,381 +872,639 @@ class FalkorDBCSVLoader:
             
             # Create constraint for each label-property combination
             for label in label_list:
-                # FalkorDB's create_constraint function expects a list of properties
-                try:
-                    if 'UNIQUE' in constraint_type:
-                        # Create unique constraint using Redis command
-                        # GRAPH.CONSTRAINT CREATE key UNIQUE NODE label PROPERTIES propCount prop [prop...]
-                        command_args = [
-                            'GRAPH.CONSTRAINT', 'CREATE', self.graph_name, 'UNIQUE', 
-                            entity_type, label, 'PROPERTIES', str(len(prop_list))
-                        ] + prop_list
-                        
-                        result = self.db.execute_command(*command_args)
-                        created_count += 1
-                        print(f"  ✅ Successfully created UNIQUE constraint on {label}({', '.join(prop_list)}), status: {result}")
-                    else:
-                        # Handle other constraint types if necessary (e.g., MANDATORY)
-                        print(f"  ⚠️ Constraint type '{constraint_type}' not supported by this loader, skipping {label}.{prop_list}")
-                        skipped_count += 1
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if 'already exists' in error_msg or 'constraint already exists' in error_msg:
-                        print(f"  ⚠️ Constraint on {label}({', '.join(prop_list)}) already exists, skipping")
-                    else:
-                        print(f"  ❌ Error creating constraint on {label}({', '.join(prop_list)}): {e}")
-                        skipped_count += 1
+                if 'UNIQUE' in constraint_type:
+                    # Create unique constraint using Redis command
+                    # GRAPH.CONSTRAINT CREATE key UNIQUE NODE label PROPERTIES propCount prop [prop...]
+                    command_args = [
+                        'GRAPH.CONSTRAINT', 'CREATE', self.graph.name, 'UNIQUE', 
+                        entity_type, label, 'PROPERTIES', len(prop_list)
+                    ] + prop_list
+                    targets.append(f"{label}({', '.join(prop_list)})")
+                    commands.append(command_args)
+                else:
+                    # Handle other constraint types if necessary (e.g., MANDATORY)
+                    print(f"  ⚠️ Constraint type '{constraint_type}' not supported by this loader, skipping {label}.{prop_list}")
+                    skipped_count += 1
+        
+        for target, result in zip(targets, self._pipeline_commands(commands)):
+            if not isinstance(result, Exception):
+                created_count += 1
+                print(f"  ✅ Successfully created UNIQUE constraint on {target}, status: {result}")
+                continue
+            error_msg = str(result).lower()
+            if 'already exists' in error_msg or 'constraint already exists' in error_msg:
+                print(f"  ⚠️ Constraint on {target} already exists, skipping")
+            else:
+                print(f"  ❌ Error creating constraint on {target}: {result}")
+                skipped_count += 1
         
         if created_count > 0:
             print(f"✅ Created {created_count} constraints")
         if skipped_count > 0:
             print(f"⚠️ Skipped {skipped_count} constraints")
     
-    def load_nodes_batch(self, file_path: str, batch_size: int = 5000):
-        """Load nodes from CSV file in batches"""
-        start_time = datetime.now()
-        print(f"[{start_time.strftime('%Y-%m-%d %H:%M:%S')}] Loading nodes from {file_path}...")
+    def _pipeline_commands(self, commands: List[List[Any]]) -> List[Any]:
+        """Send commands in one pipelined round trip, returning each reply or the error it raised"""
+        if not commands:
+            return []
+        pipe = self.db.connection.pipeline(transaction=False)
+        for command in commands:
+            pipe.execute_command(*command)
+        replies = pipe.execute(raise_on_error=False)
+        # Runtime errors come back as the last element of an otherwise normal reply
+        return [reply[-1] if isinstance(reply, list) and reply and isinstance(reply[-1], Exception) else reply for reply in replies]
+    
+    def _apply_schema(self, statements: List[str]) -> List[Any]:
+        """Run schema statements against the graph in one round trip instead of one query each"""
+        return self._pipeline_commands([['GRAPH.QUERY', self.graph.name, statement, '--compact'] for statement in statements])
+    
+    def _retry_in_chunks(self, query: str, batch_data: List[Tuple[Any, ...]], entity: str) -> int:
+        """Re-run a failed UNWIND query on halves of its batch until the failing rows are isolated"""
+        if len(batch_data) == 1:
+            print(f"Row: {batch_data[0]}")
+            return 0
         
-        # Extract label from filename (preserve original case)
-        filename = os.path.basename(file_path)
-        raw_label = filename.replace('nodes_', '').replace('.csv', '')
+        loaded = 0
+        mid = len(batch_data) // 2
+        for chunk in (batch_data[:mid], batch_data[mid:]):
+            if not chunk:
+                continue
+            try:
+                self._query_batch(query, chunk)
+                loaded += len(chunk)
+            except Exception as e:
+                if len(chunk) == 1:
+                    print(f"❌ Error loading {entity}: {e}")
+                    print(f"Row: {chunk[0]}")
+                else:
+                    loaded += self._retry_in_chunks(query, chunk, entity)
+        return loaded
+    
+    @staticmethod
+    def _node_label(file_path: str) -> str:
+        """Derive the node label from a nodes_<Label>.csv filename (preserving case)"""
+        raw_label = os.path.basename(file_path).replace('nodes_', '').replace('.csv', '')
         # Sanitize label: replace colons and other invalid characters with underscores
-        label = raw_label.replace(':', '_')
+        return raw_label.replace(':', '_')
+    
+    @staticmethod
+    def _rel_type(file_path: str) -> str:
+        """Derive the relationship type from an edges_<TYPE>.csv filename (preserving case)"""
+        return os.path.basename(file_path).replace('edges_', '').replace('.csv', '')
+    
+    def _submit_batch(self, query: str, batch_data: List[Tuple[Any, ...]], entity: str, source: str, loaded: Dict[str, int], progress: str):
+        """Run one UNWIND batch (or buffer it for a pipelined flush), adding the rows loaded to loaded[source]
         
-        rows = self.read_csv_file(file_path)
-        if not rows:
+        The "Batch complete" line (progress names what was loaded) is printed once the server has replied.
+        """
+        if not batch_data:
             return
+        start = None if self.quiet else time.perf_counter()
+        if self.pipeline_depth > 1:
+            self._pending_batches.append((query, batch_data, entity, source, loaded, progress, start))
+            if len(self._pending_batches) >= self.pipeline_depth:
+                self._flush_batches()
+            return
+        try:
+            self._query_batch(query, batch_data)
+            loaded[source] = loaded.get(source, 0) + len(batch_data)
+        except Exception as e:
+            self._report_failed_batch(query, batch_data, entity, source, loaded, e)
+        if start is not None:
+            self._print_batch_complete(len(batch_data), progress, start)
+    
+    def _query_batch(self, query: str, batch_data: List[Tuple[Any, ...]]):
+        """Run one UNWIND query with its batch parameter, raising any runtime error from the reply"""
+        reply = self.db.connection.execute_command('GRAPH.QUERY', self.graph.name, _batch_params_header(batch_data) + query, '--compact')
+        if isinstance(reply, list) and reply and isinstance(reply[-1], Exception):
+            raise reply[-1]
+        return reply
+    
+    def _report_failed_batch(self, query: str, batch_data: List[Tuple[Any, ...]], entity: str, source: str, loaded: Dict[str, int], error: Exception):
+        """Log a failed batch and load what it can in smaller chunks"""
+        print(f"❌ Error loading batch: {error}")
+        print(f"Retrying this batch in smaller chunks...")
+        # Fallback to smaller parameterized batches to isolate failing rows
+        loaded[source] = loaded.get(source, 0) + self._retry_in_chunks(query, batch_data, entity)
+    
+    def _flush_batches(self):
+        """Send all buffered batches in one pipelined round trip"""
+        if not self._pending_batches:
+            return
+        pending, self._pending_batches = self._pending_batches, []
         
-        # Debug: show CSV headers
-        if rows:
-            print(f"  CSV headers: {list(rows[0].keys())}")
+        try:
+            replies = self._pipeline_commands([
+                ['GRAPH.QUERY', self.graph.name, _batch_params_header(batch_data) + query, '--compact']
+                for query, batch_data, *_ in pending
+            ])
+        except Exception as e:
+            # A dropped connection or timeout fails the whole round trip; every batch in it goes
+            # through the per-batch fallback, as when --pipeline-depth is 1
+            replies = [e] * len(pending)
+        for (query, batch_data, entity, source, loaded, progress, start), reply in zip(pending, replies):
+            if isinstance(reply, Exception):
+                self._report_failed_batch(query, batch_data, entity, source, loaded, reply)
+            else:
+                loaded[source] = loaded.get(source, 0) + len(batch_data)
+            if start is not None:
+                self._print_batch_complete(len(batch_data), progress, start)
+    
+    def _print_batch_complete(self, count: int, what: str, start: float):
+        """Print the per-batch progress line; the wall-clock time is only formatted here"""
+        duration = _elapsed(start)
+        print(f"[{_timestamp()}] Batch complete: Loaded {count} {what} (Duration: {duration})")
+    
+    def prepare_node_batches(self, file_path: str, batch_size: int = 5000) -> Iterator[Tuple[str, List[Tuple[Any, ...]]]]:
+        """Parse a node CSV file into (UNWIND query, positional rows) batches without touching the database"""
+        label = self._node_label(file_path)
+        prop_keys = None
         
-        total_loaded = 0
+        for i, batch in enumerate(self.iter_csv_batches(file_path, batch_size)):
+            num_rows = len(next(iter(batch.values())))
+            
+            if prop_keys is None:
+                # CSV columns are fixed per file: all properties except id and labels
+                header = list(batch)
+                prop_keys = tuple(k for k in header if k not in ('id', 'labels'))
+                # Debug: show CSV headers
+                print(f"  CSV headers: {header}")
+                # The query only depends on the label and columns, so build it once per file
+                unwind_query = _build_node_cypher(label, prop_keys, self.merge_nodes)
+            
+            # Build UNWIND batch data as positional rows [id, prop1, prop2, ...];
+            # empty cells are sent as null and dropped by the server
+            ids = batch.get('id', [None] * num_rows)
+            batch_data = list(zip(ids, *[batch[key] for key in prop_keys]))
+            
+            # Debug: show properties for first few records
+            if self.debug and i == 0:
+                print(f"    Generated query: {unwind_query}")
+                for j, row in enumerate(batch_data[:3]):
+                    print(f"    Record {j+1}: properties = {dict(zip(prop_keys, row[1:]))}")
+            
+            yield unwind_query, batch_data
+    
+    def prepare_edge_batches(self, file_path: str, batch_size: int = 5000) -> Iterator[Tuple[str, List[Tuple[Any, ...]]]]:
+        """Parse an edge CSV file into (UNWIND query, positional rows) batches without touching the database"""
+        rel_type = self._rel_type(file_path)
+        prop_key_map = None
         
-        # Process in batches
-        for i in range(0, len(rows), batch_size):
-            batch_start_time = datetime.now()
-            batch = rows[i:i + batch_size]
+        for i, batch in enumerate(self.iter_csv_batches(file_path, batch_size)):
+            num_rows = len(next(iter(batch.values())))
             
-            # Build Cypher query for batch
-            query_parts = []
-            for j, row in enumerate(batch):
-                node_id = row.get('id', '')
-                properties = {}
-                
-                # Add all properties except id and labels
-                for key, value in row.items():
-                    if key not in ['id', 'labels']:
-                        # Handle empty values gracefully
-                        if value:
-                            # Try to convert to appropriate type
-                            if value.isdigit():
-                                properties[key] = int(value)
-                            elif value.replace('.', '', 1).lstrip('-').isdigit():
-                                properties[key] = float(value)
-                            else:
-                                properties[key] = value
-                        else:
-                            properties[key] = None
-                
-                # Build property string - handle None values properly
-                prop_parts = []
-                for k, v in properties.items():
-                    if v is None:
-                        # Skip None values in FalkorDB queries
+            if prop_key_map is None:
+                # CSV columns are fixed per file: map every property column to its clean key once
+                prop_key_map = {key: _clean_property_key(key) for key in batch if key not in _EDGE_META_COLUMNS}
+                prop_names = tuple(prop_key_map.values())
+            
+            missing = [None] * num_rows
+            source_ids = batch.get('source', missing)
+            target_ids = batch.get('target', missing)
+            source_labels = batch.get('source_label', missing)
+            target_labels = batch.get('target_label', missing)
+            
+            # Build UNWIND batch data as positional rows [source, target, prop1, prop2, ...],
+            # dropping rows without both endpoints and splitting by endpoint labels so each
+            # query matches a single label pair.
+            prop_columns = [batch[key] for key in prop_key_map]
+            label_pairs = set(zip(source_labels, target_labels))
+            by_labels: Dict[Tuple[str, str], List[Tuple[Any, ...]]] = {}
+            if len(label_pairs) == 1 and None not in source_ids and None not in target_ids:
+                # Usual case of one label pair and no missing endpoints: rows are a straight zip
+                (source_label, target_label), = label_pairs
+                by_labels[(_first_label(source_label), _first_label(target_label))] = list(zip(source_ids, target_ids, *prop_columns))
+            else:
+                for row in zip(source_ids, target_ids, source_labels, target_labels, *prop_columns):
+                    if row[0] is None or row[1] is None:
                         continue
-                    else:
-                        prop_parts.append(f"{k}: {repr(v)}")
-                prop_str = ', '.join(prop_parts)
+                    labels = (_first_label(row[2]), _first_label(row[3]))
+                    by_labels.setdefault(labels, []).append(row[:2] + row[4:])
+            
+            for (source_label, target_label), batch_data in by_labels.items():
+                # Sending edges ordered by source keeps the server's node lookups and
+                # adjacency matrix updates local; batches with mixed-type ids are sent unsorted
+                try:
+                    batch_data.sort(key=lambda row: row[0])
+                except TypeError:
+                    pass
                 
-                # Smart ID handling: quote if not a pure number
-                if node_id.isdigit():
-                    id_str = node_id  # Numeric ID, no quotes needed
-                else:
-                    id_str = f"'{node_id}'"  # String ID, needs quotes
+                unwind_query = _build_edge_cypher(rel_type, source_label, target_label, prop_names, self.merge_mode)
                 
-                # Debug: show properties for first few records
-                if i == 0 and j < 3:
-                    print(f"    Record {j+1}: properties = {properties}")
-                    if self.merge_mode:
-                        print(f"    Generated query: MERGE (:{label} {{id: {id_str}{', ' + prop_str if prop_str else ''}}})")
-                    else:
-                        print(f"    Generated query: CREATE (:{label} {{id: {id_str}{', ' + prop_str if prop_str else ''}}})")
+                # Debug: show label usage for first few records
+                if self.debug and i == 0:
+                    print(f"    Generated query: {unwind_query}")
+                    for j, row in enumerate(batch_data[:3]):
+                        print(f"    Record {j+1}: source_label={source_label}, target_label={target_label}, row={row}")
                 
-                # Use MERGE or CREATE based on merge_mode
-                if self.merge_mode:
-                    query_parts.append(f"MERGE (:{label} {{id: {id_str}{', ' + prop_str if prop_str else ''}}})")            
-                else:
-                    query_parts.append(f"CREATE (:{label} {{id: {id_str}{', ' + prop_str if prop_str else ''}}})")            
+                yield unwind_query, batch_data
+    
+    def load_nodes_batch(self, file_path: str, batch_size: int = 5000):
+        """Load nodes from CSV file in batches"""
+        start_time = time.perf_counter()
+        print(f"[{_timestamp()}] Loading nodes from {file_path}...")
+        
+        loaded: Dict[str, int] = {}
+        for unwind_query, batch_data in self.prepare_node_batches(file_path, batch_size):
+            # Execute batch query using UNWIND for better performance over network
+            self._submit_batch(unwind_query, batch_data, 'node', file_path, loaded, 'nodes')
+        self._flush_batches()
+        total_loaded = loaded.get(file_path, 0)
+        
+        duration = _elapsed(start_time)
+        print(f"[{_timestamp()}] ✅ Loaded {total_loaded} {self._node_label(file_path)} nodes (Duration: {duration})")
+    
+    def load_edges_batch(self, file_path: str, batch_size: int = 5000):
+        """Load edges from CSV file in batches"""
+        start_time = time.perf_counter()
+        print(f"[{_timestamp()}] Loading edges from {file_path}...")
+        
+        loaded: Dict[str, int] = {}
+        for unwind_query, batch_data in self.prepare_edge_batches(file_path, batch_size):
             # Execute batch query using UNWIND for better performance over network
+            self._submit_batch(unwind_query, batch_data, 'edge', file_path, loaded, 'edges')
+        self._flush_batches()
+        total_loaded = loaded.get(file_path, 0)
+        
+        duration = _elapsed(start_time)
+        print(f"[{_timestamp()}] ✅ Loaded {total_loaded} {self._rel_type(file_path)} relationships (Duration: {duration})")
+    
+    def _prefetched(self, file_paths: List[str]) -> Iterator[str]:
+        """Yield file paths in order while the next file is read into the page cache on a background thread"""
+        if not self.prefetch:
+            yield from file_paths
+            return
+        
+        # Only the kernel holds the next file, so memory stays bounded by the batch size
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for k, file_path in enumerate(file_paths):
+                if k + 1 < len(file_paths):
+                    executor.submit(_warm_page_cache, file_paths[k + 1])
+                yield file_path
+    
+    def _worker_loader(self):
+        """Create a copy of this loader with its own graph handle for a worker thread"""
+        # The redis client behind self.db is a thread-safe connection pool: each thread's
+        # queries check out their own connection, so batches are in flight concurrently
+        worker = copy.copy(self)
+        worker.graph = self.db.select_graph(self.graph.name)
+        worker._pending_batches = []
+        return worker
+    
+    def _load_partitions(self, partitions: List[List[str]], load_method: str, batch_size: int):
+        """Load each partition of CSV files on its own thread"""
+        def load_partition(file_paths: List[str]):
+            worker = self._worker_loader()
+            for file_path in worker._prefetched(file_paths):
+                getattr(worker, load_method)(file_path, batch_size)
+        
+        with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+            futures = [executor.submit(load_partition, partition) for partition in partitions]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error in loader thread: {e}")
+    
+    def _load_parsed(self, partitions: List[List[str]], prepare_method: str, entity: str, batch_size: int):
+        """Parse each partition of CSV files in its own process (or thread) and submit all batches over this connection"""
+        if self.parse_workers:
+            # Workers only parse, so they get a copy without the (unpicklable) connection
+            parser = copy.copy(self)
+            parser.db = parser.graph = None
+            # Bounded so parsers cannot run arbitrarily far ahead of the writer
+            batches = multiprocessing.Queue(maxsize=4 * len(partitions))
+            workers = [
+                multiprocessing.Process(target=_parse_worker, args=(parser, prepare_method, partition, batch_size, batches, worker_id), daemon=True)
+                for worker_id, partition in enumerate(partitions)
+            ]
+        else:
+            # Parse threads share this loader; they build the next batches while
+            # this thread waits on the server for the current one
+            batches = queue.Queue(maxsize=2 * len(partitions))
+            workers = [
+                threading.Thread(target=_parse_worker, args=(self, prepare_method, partition, batch_size, batches, worker_id), daemon=True)
+                for worker_id, partition in enumerate(partitions)
+            ]
+        for worker in workers:
+            worker.start()
+        
+        file_start_times: Dict[str, float] = {}
+        file_totals: Dict[str, int] = {}
+        finished = set()
+        exited = set()
+        while len(finished) < len(workers):
             try:
-                # Build batch data for UNWIND
-                batch_data = []
-                for j, row in enumerate(batch):
-                    node_id = row.get('id', '')
-                    properties = {}
-                    
-                    for key, value in row.items():
-                        if key not in ['id', 'labels'] and value:
-                            if value.isdigit():
-                                properties[key] = int(value)
-                            elif value.replace('.', '', 1).lstrip('-').isdigit():
-                                properties[key] = float(value)
-                            else:
-                                properties[key] = value
-                    
-                    # Smart ID handling
-                    if node_id.isdigit():
-                        node_id_value = int(node_id)
-                    else:
-                        node_id_value = node_id
-                    
-                    batch_data.append({'id': node_id_value, 'props': properties})
-                
-                # Create single UNWIND query for the entire batch
-                if self.merge_mode:
-                    unwind_query = f"UNWIND $batch AS row MERGE (n:{label} {{id: row.id}}) SET n += row.props"
+                item = batches.get(timeout=_PARSE_POLL_SECONDS)
+            except queue.Empty:
+                # Whatever a worker queued before it exited is readable by now, so a worker that was
+                # already gone before this wait and has not sent its end marker was killed
+                for worker_id in exited - finished:
+                    print(f"❌ Parse worker {worker_id} died (exit code {getattr(workers[worker_id], 'exitcode', None)}) before finishing its files")
+                    finished.add(worker_id)
+                exited = {worker_id for worker_id, worker in enumerate(workers) if not worker.is_alive()}
+                continue
+            if isinstance(item, int):
+                finished.add(item)
+                continue
+            
+            file_path, unwind_query, batch_data = item
+            if unwind_query is None:
+                # Settle this file's buffered batches before reporting its total
+                self._flush_batches()
+                duration = _elapsed(file_start_times.pop(file_path, time.perf_counter()))
+                if batch_data is not None:
+                    print(f"[{_timestamp()}] ❌ Parsing {file_path} failed after {file_totals.get(file_path, 0)} {entity}s: {batch_data}")
                 else:
-                    unwind_query = f"UNWIND $batch AS row CREATE (n:{label}) SET n.id = row.id, n += row.props"
-                
-                self.graph.query(unwind_query, {'batch': batch_data})
-                total_loaded += len(batch)
-                
-            except Exception as e:
-                print(f"❌ Error loading batch: {e}")
-                print(f"Falling back to individual queries for this batch...")
-                # Fallback to individual queries if batch fails
-                for query in query_parts:
-                    try:
-                        self.graph.query(query)
-                        total_loaded += 1
-                    except Exception as e2:
-                        print(f"❌ Error loading node: {e2}")
-                        print(f"Query: {query}")
+                    print(f"[{_timestamp()}] ✅ Loaded {file_totals.get(file_path, 0)} {entity}s from {file_path} (Duration: {duration})")
+                continue
             
-            batch_end_time = datetime.now()
-            batch_duration = batch_end_time - batch_start_time
-            print(f"[{batch_end_time.strftime('%Y-%m-%d %H:%M:%S')}] Batch complete: Loaded {len(batch)} nodes (Duration: {batch_duration})")
+            file_start_times.setdefault(file_path, time.perf_counter())
+            self._submit_batch(unwind_query, batch_data, entity, file_path, file_totals, f"{entity}s from {file_path}")
+        self._flush_batches()
+        for file_path in file_start_times:
+            print(f"[{_timestamp()}] ⚠️ Loaded only {file_totals.get(file_path, 0)} {entity}s from {file_path} before its parse worker died")
         
-        end_time = datetime.now()
-        duration = end_time - start_time
-        print(f"[{end_time.strftime('%Y-%m-%d %H:%M:%S')}] ✅ Loaded {total_loaded} {label} nodes (Duration: {duration})")
+        for worker in workers:
+            worker.join()
     
-    def load_edges_batch(self, file_path: str, batch_size: int = 5000):
-        """Load edges from CSV file in batches"""
-        start_time = datetime.now()
-        print(f"[{start_time.strftime('%Y-%m-%d %H:%M:%S')}] Loading edges from {file_path}...")
+    @staticmethod
+    def _balanced_partitions(groups: List[List[str]], workers: int) -> List[List[str]]:
+        """Deal groups of files to workers largest first, each to the partition with the fewest bytes so far"""
+        def group_size(group: List[str]) -> int:
+            size = 0
+            for path in group:
+                try:
+                    size += os.path.getsize(path)
+                except OSError:
+                    pass
+            return size
         
-        # Extract relationship type from filename (preserve original case)
-        filename = os.path.basename(file_path)
-        rel_type = filename.replace('edges_', '').replace('.csv', '')
+        partitions: List[List[str]] = [[] for _ in range(workers)]
+        loads = [0] * workers
+        for size, group in sorted(((group_size(group), group) for group in groups), key=lambda item: item[0], reverse=True):
+            # Ties (e.g. empty files) go to the partition with the fewest files
+            k = min(range(workers), key=lambda j: (loads[j], len(partitions[j])))
+            partitions[k].extend(group)
+            loads[k] += size
+        return partitions
+    
+    def load_all_nodes(self, node_paths: List[str], batch_size: int = 5000):
+        """Load node CSV files, spreading them across parse workers or loader threads"""
+        if (self.parse_workers or self.parse_threads) and node_paths:
+            workers = min(self.parse_workers or self.parse_threads, len(node_paths))
+            # Label files parse independently; balancing by size keeps one large file from idling the other parsers
+            partitions = self._balanced_partitions([[path] for path in node_paths], workers)
+            self._load_parsed(partitions, 'prepare_node_batches', 'node', batch_size)
+            return
         
-        rows = self.read_csv_file(file_path)
-        if not rows:
+        threads = min(self.loader_threads, len(node_paths))
+        if threads <= 1:
+            for file_path in self._prefetched(node_paths):
+                self.load_nodes_batch(file_path, batch_size)
             return
         
-        total_loaded = 0
+        # Node files write disjoint labels, so any file can go to any thread
+        partitions = self._balanced_partitions([[path] for path in node_paths], threads)
+        self._load_partitions(partitions, 'load_nodes_batch', batch_size)
+    
+    def _bin_edges(self, file_path: str, bins: int, bin_dir: str) -> List[str]:
+        """Split an edge CSV into bin files by hash(source id), so no two bins share a source node
         
-        # Process in batches
-        for i in range(0, len(rows), batch_size):
-            batch_start_time = datetime.now()
-            batch = rows[i:i + batch_size]
+        The id is hashed as the loader types it, so spellings of one id such as '1' and '01' share a bin.
+        """
+        file_name = os.path.basename(file_path)
+        bin_paths = [os.path.join(bin_dir, f"bin_{k}", file_name) for k in range(bins)]
+        with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return []
+            source_index = header.index('source') if 'source' in header else 0
             
-            # Build Cypher query for batch
-            query_parts = []
-            for j, row in enumerate(batch):
-                source_id = row.get('source', '')
-                target_id = row.get('target', '')
-                
-                if not source_id or not target_id:
+            bin_files = []
+            try:
+                writers = []
+                for bin_path in bin_paths:
+                    os.makedirs(os.path.dirname(bin_path), exist_ok=True)
+                    bin_file = open(bin_path, 'w', encoding='utf-8', newline='')
+                    bin_files.append(bin_file)
+                    writer = csv.writer(bin_file)
+                    writer.writerow(header)
+                    writers.append(writer)
+                for row in reader:
+                    if not row:
+                        continue
+                    source = row[source_index] if source_index < len(row) else ''
+                    writers[hash(_coerce(source)) % bins].writerow(row)
+            finally:
+                for bin_file in bin_files:
+                    bin_file.close()
+        return bin_paths
+    
+    def _sort_edges(self, file_path: str, sort_dir: str) -> str:
+        """Externally sort an edge CSV by (source, target) into sort_dir; returns file_path itself when already in order"""
+        with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return file_path
+            source_index = header.index('source') if 'source' in header else 0
+            target_index = header.index('target') if 'target' in header else 1
+            
+            def row_key(row: List[str]) -> Tuple[Tuple[int, Any], Tuple[int, Any]]:
+                source = row[source_index] if source_index < len(row) else ''
+                target = row[target_index] if target_index < len(row) else ''
+                return _edge_sort_key(source), _edge_sort_key(target)
+            
+            os.makedirs(sort_dir, exist_ok=True)
+            sorted_path = os.path.join(sort_dir, os.path.basename(file_path))
+            run_paths = []
+            in_order = True
+            previous = None
+            rows = []
+            for row in reader:
+                if not row:
                     continue
+                key = row_key(row)
+                if in_order and previous is not None and key < previous:
+                    in_order = False
+                previous = key
+                rows.append(row)
+                if len(rows) == _SORT_RUN_ROWS:
+                    # Spill a sorted run so memory stays bounded by the run size
+                    run_path = f"{sorted_path}.run{len(run_paths)}"
+                    rows.sort(key=row_key)
+                    with open(run_path, 'w', encoding='utf-8', newline='') as run_file:
+                        csv.writer(run_file).writerows(rows)
+                    run_paths.append(run_path)
+                    rows = []
+        
+        if in_order:
+            for run_path in run_paths:
+                os.remove(run_path)
+            return file_path
+        
+        rows.sort(key=row_key)
+        run_count = len(run_paths)
+        while len(run_paths) >= _SORT_MERGE_RUNS:
+            # Merge consecutive groups of runs into longer runs, keeping them in file order
+            merged_paths = []
+            for start in range(0, len(run_paths), _SORT_MERGE_RUNS):
+                group = run_paths[start:start + _SORT_MERGE_RUNS]
+                if len(group) == 1:
+                    merged_paths.append(group[0])
+                    continue
+                merged_path = f"{sorted_path}.run{run_count}"
+                run_count += 1
+                _merge_sorted_runs(group, merged_path, row_key)
+                merged_paths.append(merged_path)
+            run_paths = merged_paths
+        _merge_sorted_runs(run_paths, sorted_path, row_key, rows, header)
+        return sorted_path
+    
+    def load_all_edges(self, edge_paths: List[str], batch_size: int = 5000):
+        """Load edge CSV files, sorting them by source id first with --presort-edges"""
+        if not (self.presort_edges and edge_paths):
+            self._load_edge_files(edge_paths, batch_size)
+            return
+        
+        # Whole files in source order keep the server's adjacency updates local across batches,
+        # not just within each one. Files are sorted and loaded one at a time, so the temporary
+        # directory only ever holds one sorted copy
+        with tempfile.TemporaryDirectory(prefix='falkordb_sorted_edges_') as sort_dir:
+            for file_path in edge_paths:
+                sort_start_time = time.perf_counter()
+                sorted_path = self._sort_edges(file_path, sort_dir)
+                if sorted_path == file_path:
+                    print(f"  🔃 {file_path} is already sorted by source id (checked in {_elapsed(sort_start_time)})")
+                else:
+                    print(f"  🔃 Sorted {file_path} by source id (Duration: {_elapsed(sort_start_time)})")
+                try:
+                    self._load_edge_files([sorted_path], batch_size)
+                finally:
+                    if sorted_path != file_path:
+                        os.remove(sorted_path)
+    
+    def _load_edge_files(self, edge_paths: List[str], batch_size: int = 5000):
+        """Load edge CSV files, keeping each relationship type on a single parse worker or loader thread"""
+        if self.parallel_edges > 1:
+            # Each file's bins are loaded concurrently, one thread and graph handle per bin
+            with tempfile.TemporaryDirectory(prefix='falkordb_edge_bins_') as bin_dir:
+                for index, file_path in enumerate(edge_paths):
+                    print(f"  🔀 Splitting {file_path} into {self.parallel_edges} bins by source id")
+                    bin_paths = self._bin_edges(file_path, self.parallel_edges, os.path.join(bin_dir, str(index)))
+                    if bin_paths:
+                        self._load_partitions([[bin_path] for bin_path in bin_paths], 'load_edges_batch', batch_size)
+            return
+        
+        by_rel_type: Dict[str, List[str]] = {}
+        for file_path in edge_paths:
+            by_rel_type.setdefault(self._rel_type(file_path), []).append(file_path)
+        groups = list(by_rel_type.values())
+        
+        if (self.parse_workers or self.parse_threads) and groups:
+            workers = min(self.parse_workers or self.parse_threads, len(groups))
+            partitions = self._balanced_partitions(groups, workers)
+            self._load_parsed(partitions, 'prepare_edge_batches', 'edge', batch_size)
+            return
+        
+        threads = min(self.loader_threads, len(by_rel_type))
+        if threads <= 1:
+            for file_path in self._prefetched(edge_paths):
+                self.load_edges_batch(file_path, batch_size)
+            return
+        
+        # One relationship type never spans two threads, avoiding concurrent MERGEs on the same pattern
+        partitions = self._balanced_partitions(groups, threads)
+        self._load_partitions(partitions, 'load_edges_batch', batch_size)
+    
+    def _send_bulk(self, labels: List[bytes], reltypes: List[bytes], node_count: int, edge_count: int, begin: bool):
+        """Send one GRAPH.BULK command; the first command of a load must carry BEGIN"""
+        args = [node_count, edge_count, len(labels), len(reltypes)] + labels + reltypes
+        if begin:
+            args.insert(0, 'BEGIN')
+        return self.db.execute_command('GRAPH.BULK', self.graph.name, *args)
+    
+    def bulk_load(self, node_paths: List[str], edge_paths: List[str], batch_size: int = 5000) -> bool:
+        """
+        Load nodes and edges into a new graph with the binary GRAPH.BULK protocol
+        
+        Skips Cypher parsing and planning per batch. Returns False without writing anything
+        if the server rejects the first command (e.g. the graph already exists).
+        """
+        # GRAPH.BULK assigns node IDs sequentially, edges refer to nodes by that offset
+        labeled_offsets: Dict[Any, int] = {}
+        offsets: Dict[Any, int] = {}
+        node_count = 0
+        edge_count = 0
+        skipped_edges = 0
+        begin = True
+        
+        for file_path in self._prefetched(node_paths):
+            label = self._node_label(file_path)
+            header = None
+            for batch in self.iter_csv_batches(file_path, batch_size):
+                num_rows = len(next(iter(batch.values())))
+                if header is None:
+                    # Property names are fixed per file, so the binary header is built once
+                    prop_names = [key for key in batch if key != 'labels']
+                    header = _pack_bulk_header(label, prop_names)
                 
-                properties = {}
-                
-                # Get source and target labels if available
-                source_label = row.get('source_label', '').strip()
-                target_label = row.get('target_label', '').strip()
-                
-                # Add all properties except source, target, type, source_label, target_label
-                for key, value in row.items():
-                    if key not in ['source', 'target', 'type', 'source_label', 'target_label'] and value:
-                        # Clean up property key: remove duplicate prefixes like 'Date:Date' -> 'Date'
-                        clean_key = key
-                        if ':' in key:
-                            parts = key.split(':')
-                            if len(parts) == 2 and parts[0] == parts[1]:
-                                clean_key = parts[0]
-                        
-                        # Try to convert to appropriate type
-                        if value.isdigit():
-                            properties[clean_key] = int(value)
-                        elif value.replace('.', '', 1).isdigit():
-                            properties[clean_key] = float(value)
-                        else:
-                            properties[clean_key] = value
-                
-                # Build property string
-                prop_str = ', '.join([f"{k}: {repr(v)}" for k, v in properties.items()])
-                
-                # Smart ID handling for both source and target
-                source_id_str = source_id if source_id.isdigit() else f"'{source_id}'"
-                target_id_str = target_id if target_id.isdigit() else f"'{target_id}'"
+                ids = batch.get('id', [None] * num_rows)
+                prop_columns = [batch[key] for key in prop_names]
+                entities = [header]
+                for r in range(num_rows):
+                    labeled_offsets[(label, ids[r])] = node_count + r
+                    offsets.setdefault(ids[r], node_count + r)
+                    entities.append(b''.join([_pack_bulk_value(column[r]) for column in prop_columns]))
                 
-                # Build MATCH clause with labels if available
-                if source_label and target_label:
-                    # Use specific labels for more efficient matching
-                    # Handle multiple labels by taking the first one (e.g., "OS:Process" -> "OS")
-                    source_label_first = source_label.split(':')[0]
-                    target_label_first = target_label.split(':')[0]
-                    
-                    if self.merge_mode:
-                        # Use MERGE for upsert behavior - merge both nodes and relationship
-                        query_parts.append(
-                            f"MERGE (a:{source_label_first} {{id: {source_id_str}}}) "
-                            f"MERGE (b:{target_label_first} {{id: {target_id_str}}}) "
-                            f"MERGE (a)-[r:{rel_type}]->(b)"
-                            f"{' SET ' + ', '.join([f'r.{k} = {repr(v)}' for k, v in properties.items()]) if properties else ''}"
-                        )
-                    else:
-                        # Use MATCH + CREATE for original behavior
-                        match_clause = f"MATCH (a:{source_label_first} {{id: {source_id_str}}}), (b:{target_label_first} {{id: {target_id_str}}})"
-                        query_parts.append(
-                            f"{match_clause} "
-                            f"CREATE (a)-[:{rel_type}{' {' + prop_str + '}' if prop_str else ''}]->(b)"
-                        )
-                else:
-                    # Fallback to generic matching without labels
-                    if self.merge_mode:
-                        # Use MERGE for upsert behavior - merge both nodes and relationship
-                        query_parts.append(
-                            f"MERGE (a {{id: {source_id_str}}}) "
-                            f"MERGE (b {{id: {target_id_str}}}) "
-                            f"MERGE (a)-[r:{rel_type}]->(b)"
-                            f"{' SET ' + ', '.join([f'r.{k} = {repr(v)}' for k, v in properties.items()]) if properties else ''}"
-                        )
-                    else:
-                        # Use MATCH + CREATE for original behavior
-                        match_clause = f"MATCH (a {{id: {source_id_str}}}), (b {{id: {target_id_str}}})"
-                        query_parts.append(
-                            f"{match_clause} "
-                            f"CREATE (a)-[:{rel_type}{' {' + prop_str + '}' if prop_str else ''}]->(b)"
-                        )
+                try:
+                    self._send_bulk([b''.join(entities)], [], num_rows, 0, begin)
+                except Exception as e:
+                    if not begin:
+                        raise
+                    print(f"⚠️ GRAPH.BULK rejected ({e}), falling back to UNWIND queries")
+                    return False
+                begin = False
+                node_count += num_rows
+            print(f"  ✅ Bulk loaded {label} nodes from {file_path}")
+        
+        for file_path in self._prefetched(edge_paths):
+            rel_type = self._rel_type(file_path)
+            header = None
+            for batch in self.iter_csv_batches(file_path, batch_size):
+                num_rows = len(next(iter(batch.values())))
+                if header is None:
+                    prop_keys = [key for key in batch if key not in _EDGE_META_COLUMNS]
+                    prop_names = [_clean_property_key(key) for key in prop_keys]
+                    header = _pack_bulk_header(rel_type, prop_names)
                 
-                # Debug: show label usage for first few records
-                if i == 0 and j < 3:
-                    print(f"    Record {j+1}: source_label={source_label}, target_label={target_label}")
-                    if self.merge_mode:
-                        print(f"    Using MERGE mode for relationships")
-                    else:
-                        print(f"    Using CREATE mode for relationships")
-            
-            # Execute batch query using UNWIND for better performance over network
-            try:
-                # Build batch data for UNWIND
-                batch_data = []
-                for j, row in enumerate(batch):
-                    source_id = row.get('source', '')
-                    target_id = row.get('target', '')
-                    
-                    if not source_id or not target_id:
+                missing = [None] * num_rows
+                source_ids = batch.get('source', missing)
+                target_ids = batch.get('target', missing)
+                source_labels = batch.get('source_label', missing)
+                target_labels = batch.get('target_label', missing)
+                prop_columns = [batch[key] for key in prop_keys]
+                entities = [header]
+                for r in range(num_rows):
+                    source = labeled_offsets.get((_first_label(source_labels[r]), source_ids[r]), offsets.get(source_ids[r]))
+                    target = labeled_offsets.get((_first_label(target_labels[r]), target_ids[r]), offsets.get(target_ids[r]))
+                    if source is None or target is None:
+                        skipped_edges += 1
                         continue
-                    
-                    properties = {}
-                    source_label = row.get('source_label', '').strip()
-                    target_label = row.get('target_label', '').strip()
-                    
-                    for key, value in row.items():
-                        if key not in ['source', 'target', 'type', 'source_label', 'target_label'] and value:
-                            clean_key = key
-                            if ':' in key:
-                                parts = key.split(':')
-                                if len(parts) == 2 and parts[0] == parts[1]:
-                                    clean_key = parts[0]
-                            
-                            if value.isdigit():
-                                properties[clean_key] = int(value)
-                            elif value.replace('.', '', 1).isdigit():
-                                properties[clean_key] = float(value)
-                            else:
-                                properties[clean_key] = value
-                    
-                    # Smart ID handling
-                    source_id_value = int(source_id) if source_id.isdigit() else source_id
-                    target_id_value = int(target_id) if target_id.isdigit() else target_id
-                    
-                    # Get first label for nodes
-                    source_label_first = source_label.split(':')[0] if source_label and ':' in source_label else source_label
-                    target_label_first = target_label.split(':')[0] if target_label and ':' in target_label else target_label
-                    
-                    batch_data.append({
-                        'source_id': source_id_value,
-                        'target_id': target_id_value,
-                        'source_label': source_label_first,
-                        'target_label': target_label_first,
-                        'props': properties
-                    })
+                    entities.append(_BULK_EDGE.pack(source, target) + b''.join([_pack_bulk_value(column[r]) for column in prop_columns]))
                 
-                # Create single UNWIND query for the entire batch
-                if batch_data:
-                    if self.merge_mode:
-                        # Use MERGE mode with label matching if available
-                        if batch_data[0]['source_label'] and batch_data[0]['target_label']:
-                            unwind_query = f"""
-                            UNWIND $batch AS row
-                            MERGE (a:{batch_data[0]['source_label']} {{id: row.source_id}})
-                            MERGE (b:{batch_data[0]['target_label']} {{id: row.target_id}})
-                            MERGE (a)-[r:{rel_type}]->(b)
-                            SET r += row.props
-                            """
-                        else:
-                            unwind_query = f"""
-                            UNWIND $batch AS row
-                            MERGE (a {{id: row.source_id}})
-                            MERGE (b {{id: row.target_id}})
-                            MERGE (a)-[r:{rel_type}]->(b)
-                            SET r += row.props
-                            """
-                    else:
-                        # Use CREATE mode with label matching if available
-                        if batch_data[0]['source_label'] and batch_data[0]['target_label']:
-                            unwind_query = f"""
-                            UNWIND $batch AS row
-                            MATCH (a:{batch_data[0]['source_label']} {{id: row.source_id}})
-                            MATCH (b:{batch_data[0]['target_label']} {{id: row.target_id}})
-                            CREATE (a)-[r:{rel_type}]->(b)
-                            SET r += row.props
-                            """
-                        else:
-                            unwind_query = f"""
-                            UNWIND $batch AS row
-                            MATCH (a {{id: row.source_id}})
-                            MATCH (b {{id: row.target_id}})
-                            CREATE (a)-[r:{rel_type}]->(b)
-                            SET r += row.props
-                            """
-                    
-                    self.graph.query(unwind_query, {'batch': batch_data})
-                    total_loaded += len(batch_data)
-                    
-            except Exception as e:
-                print(f"❌ Error loading batch: {e}")
-                print(f"Falling back to individual queries for this batch...")
-                # Fallback to individual queries if batch fails
-                for query in query_parts:
-                    try:
-                        self.graph.query(query)
-                        total_loaded += 1
-                    except Exception as e2:
-                        print(f"❌ Error loading edge: {e2}")
-                        print(f"Query: {query}")
-            
-            batch_end_time = datetime.now()
-            batch_duration = batch_end_time - batch_start_time
-            print(f"[{batch_end_time.strftime('%Y-%m-%d %H:%M:%S')}] Batch complete: Loaded {len(batch)} edges (Duration: {batch_duration})")
+                if len(entities) > 1:
+                    self._send_bulk([], [b''.join(entities)], 0, len(entities) - 1, begin)
+                    begin = False
+                    edge_count += len(entities) - 1
+            print(f"  ✅ Bulk loaded {rel_type} relationships from {file_path}")
         
-        end_time = datetime.now()
-        duration = end_time - start_time
-        print(f"[{end_time.strftime('%Y-%m-%d %H:%M:%S')}] ✅ Loaded {total_loaded} {rel_type} relationships (Duration: {duration})")
+        print(f"✅ Bulk loaded {node_count} nodes and {edge_count} relationships")
+        if skipped_edges > 0:
+            print(f"⚠️ Skipped {skipped_edges} edges whose source or target node is not in the node CSV files")
+        return True
     
     def load_all_csvs(self, batch_size: int = 5000):
         """Load all CSV files from the csv_output directory"""
@@ -619,104 +1512,196 @@ class FalkorDBCSVLoader:
             print(f"❌ Directory {self.csv_dir} does not exist")
             return
         
+        if self.merge_mode and self.assume_unique:
+            print("⚠️ --assume-unique: nodes are created without MERGE; duplicate or already loaded ids will create duplicate nodes")
+        if self.parallel_edges > 1 and (self.parse_workers or self.parse_threads or self.loader_threads > 1):
+            print("⚠️ --parallel-edges: edge files are loaded by one thread per bin; --parse-workers, --parse-threads and --loader-threads only apply to nodes")
+        
         # Check for multi-graph mode (presence of tenant_* subdirectories)
         if self.multi_graph_mode:
             self._load_multi_graph_csvs(batch_size)
         else:
             self._load_single_graph_csvs(batch_size)
     
+    def _build_schema(self, title: str, steps: List[Any]):
+        """Run schema creation steps, reporting how long they took"""
+        start_time = time.perf_counter()
+        print(f"\n[{_timestamp()}] 🗼️ {title}...")
+        for step in steps:
+            step()
+        print(f"[{_timestamp()}] ✅ {title} done (Duration: {_elapsed(start_time)})")
+    
+    def _load_one_graph(self, csv_dir: str, graph, batch_size: int = 5000):
+        """Load one directory into one graph through a copy of this loader, leaving this loader's graph and csv_dir untouched"""
+        loader = copy.copy(self)
+        loader.csv_dir = csv_dir
+        loader.graph = graph
+        loader._pending_batches = []
+        loader._load_single_graph_csvs(batch_size)
+    
     def _load_single_graph_csvs(self, batch_size: int = 5000):
         """Load CSV files into a single graph"""
-        csv_files = os.listdir(self.csv_dir)
-        node_files = [f for f in csv_files if f.startswith('nodes_') and f.endswith('.csv')]
-        edge_files = [f for f in csv_files if f.startswith('edges_') and f.endswith('.csv')]
+        node_paths, edge_paths = self._scan_csv_files(self.csv_dir)
+        print(f"Found {len(node_paths)} node files and {len(edge_paths)} edge files")
         
-        print(f"Found {len(node_files)} node files and {len(edge_files)} edge files")
+        # GRAPH.BULK only creates new graphs, so it runs before any schema is set up
+        if self.bulk_mode and not self.merge_mode:
+            bulk_start_time = time.perf_counter()
+            print(f"\n[{_timestamp()}] 📦 Bulk loading nodes and edges...")
+            if self.bulk_load(node_paths, edge_paths, batch_size):
+                self._build_schema("Setting up database schema", [
+                    self.create_id_indexes_for_all_labels,
+                    self.create_indexes_from_csv,
+                    self.create_supporting_indexes_for_constraints,
+                    self.create_constraints_from_csv,
+                ])
+                
+                total_duration = _elapsed(bulk_start_time)
+                print(f"\n[{_timestamp()}] ✅ Successfully loaded data into graph '{self.graph.name}' (Total loading time: {total_duration})")
+                return
         
-        # Create indexes and constraints first (for better performance)
-        print("\n🗼️ Setting up database schema...")
-        self.create_id_indexes_for_all_labels()  # Create ID indexes first for better performance
-        self.create_indexes_from_csv()
-        self.create_supporting_indexes_for_constraints()
-        self.create_constraints_from_csv()
+        load_start_time = time.perf_counter()
+        if not self.defer_indexes:
+            # Create indexes and constraints first
+            self._build_schema("Setting up database schema", [
+                self.create_id_indexes_for_all_labels,
+                self.create_indexes_from_csv,
+                self.create_supporting_indexes_for_constraints,
+                self.create_constraints_from_csv,
+            ])
+        elif self.merge_nodes:
+            # MERGE looks nodes up by id and relies on the unique constraints to stay correct
+            self._build_schema("Setting up indexes and constraints required by MERGE", [
+                self.create_id_indexes_for_all_labels,
+                self.create_supporting_indexes_for_constraints,
+                self.create_constraints_from_csv,
+            ])
         
         # Load nodes first
-        nodes_start_time = datetime.now()
-        print(f"\n[{nodes_start_time.strftime('%Y-%m-%d %H:%M:%S')}] 📥 Loading nodes...")
-        for node_file in node_files:
-            file_path = os.path.join(self.csv_dir, node_file)
-            self.load_nodes_batch(file_path, batch_size)
+        nodes_start_time = time.perf_counter()
+        print(f"\n[{_timestamp()}] 📥 Loading nodes...")
+        self.load_all_nodes(node_paths, batch_size)
         
-        nodes_end_time = datetime.now()
-        nodes_duration = nodes_end_time - nodes_start_time
-        print(f"[{nodes_end_time.strftime('%Y-%m-%d %H:%M:%S')}] ✅ All nodes loaded (Total duration: {nodes_duration})")
+        nodes_duration = _elapsed(nodes_start_time)
+        print(f"[{_timestamp()}] ✅ All nodes loaded (Total duration: {nodes_duration})")
+        
+        if self.defer_indexes and not self.merge_nodes:
+            # Edges MATCH (or MERGE) their endpoints by id, so the id indexes are built once the nodes are in
+            self._build_schema("Building ID indexes", [self.create_id_indexes_for_all_labels])
         
         # Then load edges
-        edges_start_time = datetime.now()
-        print(f"\n[{edges_start_time.strftime('%Y-%m-%d %H:%M:%S')}] 🔗 Loading edges...")
-        for edge_file in edge_files:
-            file_path = os.path.join(self.csv_dir, edge_file)
-            self.load_edges_batch(file_path, batch_size)
+        edges_start_time = time.perf_counter()
+        print(f"\n[{_timestamp()}] 🔗 Loading edges...")
+        self.load_all_edges(edge_paths, batch_size)
+        
+        edges_duration = _elapsed(edges_start_time)
+        print(f"[{_timestamp()}] ✅ All edges loaded (Total duration: {edges_duration})")
         
-        edges_end_time = datetime.now()
-        edges_duration = edges_end_time - edges_start_time
-        print(f"[{edges_end_time.strftime('%Y-%m-%d %H:%M:%S')}] ✅ All edges loaded (Total duration: {edges_duration})")
+        if self.defer_indexes:
+            # Remaining indexes are built once over the loaded data instead of being maintained per write
+            steps = [self.create_indexes_from_csv]
+            if not self.merge_nodes:
+                # With --assume-unique, building the unique constraints last also checks that assumption
+                steps += [self.create_supporting_indexes_for_constraints, self.create_constraints_from_csv]
+            self._build_schema("Building deferred indexes and constraints", steps)
         
-        total_end_time = datetime.now()
-        total_duration = total_end_time - nodes_start_time
-        print(f"\n[{total_end_time.strftime('%Y-%m-%d %H:%M:%S')}] ✅ Successfully loaded data into graph '{self.graph_name}' (Total loading time: {total_duration})")
+        total_duration = _elapsed(load_start_time)
+        print(f"\n[{_timestamp()}] ✅ Successfully loaded data into graph '{self.graph.name}' (Total loading time: {total_duration})")
+    
+    async def _load_tenant_async(self, tenant_name: str, tenant_path: str, graph_name: str, batch_size: int, semaphore: asyncio.Semaphore) -> Tuple[str, timedelta, str]:
+        """Load one tenant on a worker thread once the semaphore admits it; returns (tenant, duration, error)"""
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(self._load_one_graph, tenant_path, self.db.select_graph(graph_name), batch_size)
+                error = None
+            except Exception as e:
+                error = str(e)
+            return tenant_name, _elapsed(start), error
+    
+    async def _load_tenants_async(self, tenants: List[Tuple[str, str, str]], workers: int, batch_size: int) -> List[Tuple[str, timedelta, str]]:
+        """Dispatch every tenant on one event loop, at most workers at a time"""
+        # asyncio.to_thread() runs on the default executor, which would otherwise cap workers at min(32, cpus + 4)
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=workers))
+        semaphore = asyncio.Semaphore(workers)
+        return await asyncio.gather(*(self._load_tenant_async(*tenant, batch_size, semaphore) for tenant in tenants))
+    
+    def _load_tenants_in_parallel(self, tenants: List[Tuple[str, str, str]], workers: int, batch_size: int):
+        """Load (tenant name, path, graph name) tenants concurrently, one graph per tenant, in processes or on an event loop"""
+        # Tenants write disjoint graphs, so their loads never contend for the same write lock
+        if self.async_tenants:
+            # Threads share this process's connection pool (one connection each) and skip
+            # the fork/pickle cost of a process per tenant; waits on the network overlap
+            print(f"⚡ Loading {len(tenants)} tenants on one event loop, {workers} at a time")
+            self._report_tenants(asyncio.run(self._load_tenants_async(tenants, workers, batch_size)))
+        else:
+            tenant_loader = copy.copy(self)
+            tenant_loader.db = tenant_loader.graph = None
+            print(f"⚡ Loading {len(tenants)} tenants with {workers} parallel processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                self._report_tenants(executor.map(_load_tenant, [(tenant_loader, *tenant, batch_size) for tenant in tenants]))
+    
+    @staticmethod
+    def _report_tenants(results: Iterator[Tuple[str, timedelta, str]]):
+        """Print each tenant's outcome as it arrives, then the summed tenant load time"""
+        total_tenant_time = timedelta()
+        for tenant_name, duration, error in results:
+            total_tenant_time += duration
+            if error:
+                print(f"\n❌ Error loading tenant '{tenant_name}': {error}")
+            else:
+                print(f"\n✅ Completed loading tenant '{tenant_name}' in {duration}")
+        print(f"   Sum of tenant load times: {total_tenant_time}")
     
     def _load_multi_graph_csvs(self, batch_size: int = 5000):
         """Load CSV files from tenant subdirectories into separate graphs"""
         # Find all tenant subdirectories
-        subdirs = [d for d in os.listdir(self.csv_dir) 
-                   if os.path.isdir(os.path.join(self.csv_dir, d)) and d.startswith('tenant_')]
+        # One pass that keeps each entry's path; names are filtered before is_dir(), which may need a stat call
+        with os.scandir(self.csv_dir) as entries:
+            tenant_paths = {entry.name: entry.path for entry in entries if entry.name.startswith('tenant_') and entry.is_dir()}
+        subdirs = sorted(tenant_paths)
         
         if not subdirs:
             print(f"⚠️  No tenant subdirectories found in {self.csv_dir}")
             print("   Falling back to single-graph mode...")
-            self._load_single_graph_csvs(batch_size)
+            self.tenant_graphs = [self.graph_name]
+            self._load_one_graph(self.csv_dir, self.db.select_graph(self.graph_name), batch_size)
             return
         
         print(f"\n🗂️  Found {len(subdirs)} tenant directories: {subdirs}")
         print(f"   Each will be loaded into a separate graph\n")
         
-        overall_start_time = datetime.now()
-        
-        for tenant_dir in sorted(subdirs):
-            tenant_path = os.path.join(self.csv_dir, tenant_dir)
-            
-            # Extract tenant name from directory (remove 'tenant_' prefix)
+        # (tenant name, source directory, target graph) per tenant; the name drops the 'tenant_' prefix
+        tenants = []
+        for tenant_dir in subdirs:
             tenant_name = tenant_dir.replace('tenant_', '')
-            graph_name = f"{self.graph_name}_{tenant_name}"
-            
-            print(f"\n{'='*80}")
-            print(f"📊 Processing tenant: {tenant_name}")
-            print(f"   Target graph: {graph_name}")
-            print(f"   Source directory: {tenant_path}")
-            print(f"{'='*80}\n")
-            
-            # Switch to this tenant's graph
-            self.graph = self.db.select_graph(graph_name)
-            
-            # Temporarily update csv_dir to point to tenant directory
-            original_csv_dir = self.csv_dir
-            self.csv_dir = tenant_path
-            
-            try:
-                # Load this tenant's data
-                tenant_start_time = datetime.now()
-                self._load_single_graph_csvs(batch_size)
-                tenant_duration = datetime.now() - tenant_start_time
-                print(f"\n✅ Completed loading tenant '{tenant_name}' in {tenant_duration}")
-                
-            except Exception as e:
-                print(f"\n❌ Error loading tenant '{tenant_name}': {e}")
-            finally:
-                # Restore original csv_dir
-                self.csv_dir = original_csv_dir
+            tenants.append((tenant_name, tenant_paths[tenant_dir], f"{self.graph_name}_{tenant_name}"))
+        self.tenant_graphs = [graph_name for _, _, graph_name in tenants]
+        
+        overall_start_time = time.perf_counter()
         
-        overall_duration = datetime.now() - overall_start_time
+        workers = min(self.parallel_tenants or 8, len(tenants))
+        if workers > 1:
+            self._load_tenants_in_parallel(tenants, workers, batch_size)
+        else:
+            for tenant_name, tenant_path, graph_name in tenants:
+                print(f"\n{'='*80}")
+                print(f"📊 Processing tenant: {tenant_name}")
+                print(f"   Target graph: {graph_name}")
+                print(f"   Source directory: {tenant_path}")
+                print(f"{'='*80}\n")
+
+                try:
+                    # Load this tenant's data into its own graph
+                    tenant_start_time = time.perf_counter()
+                    self._load_one_graph(tenant_path, self.db.select_graph(graph_name), batch_size)
+                    tenant_duration = _elapsed(tenant_start_time)
+                    print(f"\n✅ Completed loading tenant '{tenant_name}' in {tenant_duration}")
+
+                except Exception as e:
+                    print(f"\n❌ Error loading tenant '{tenant_name}': {e}")
+        
+        overall_duration = _elapsed(overall_start_time)
         print(f"\n{'='*80}")
         print(f"✅ Multi-graph loading complete!")
         print(f"   Loaded {len(subdirs)} tenants into separate graphs")
@@ -742,7 +1727,7 @@ class FalkorDBCSVLoader:
         try:
             # Count nodes by label
             node_result = self.graph.query("MATCH (n) RETURN labels(n) as labels, count(n) as count")
-            print("\n📊 Graph Statistics:")
+            print(f"\n📊 Graph Statistics for '{self.graph.name}':")
             print("Nodes:")
             for record in node_result.result_set:
                 labels = record[0] if record[0] else ['Unknown']
@@ -785,24 +1770,54 @@ Examples:
     parser.add_argument('graph_name', help='Target graph name in FalkorDB (used as prefix in multi-graph mode)')
     parser.add_argument('--host', default='localhost', help='FalkorDB host')
     parser.add_argument('--port', type=int, default=6379, help='FalkorDB port')
+    parser.add_argument('--unix-socket', help='Connect through the server\'s UNIX socket at this path instead of host/port (local servers only)')
     parser.add_argument('--username', help='FalkorDB username (optional)')
     parser.add_argument('--password', help='FalkorDB password (optional)')
     parser.add_argument('--batch-size', type=int, default=5000, help='Batch size for loading (default: 5000)')
     parser.add_argument('--stats', action='store_true', help='Show graph statistics after loading')
     parser.add_argument('--csv-dir', default='csv_output', help='Directory containing CSV files (default: csv_output)')
     parser.add_argument('--merge-mode', action='store_true', help='Use MERGE instead of CREATE for upsert behavior')
+    parser.add_argument('--assume-unique', action='store_true', help='With --merge-mode, CREATE nodes instead of MERGE when the node CSVs are known to hold no duplicate or existing ids; edges still use MERGE')
     parser.add_argument('--multi-graph', action='store_true', help='Enable multi-graph mode: load each tenant_* subfolder into a separate graph')
+    parser.add_argument('--defer-indexes', action=argparse.BooleanOptionalAction, default=True, help='Build indexes and constraints after loading the data; ID indexes are built before edges, and MERGE mode still creates ID indexes and constraints first (default: on)')
+    parser.add_argument('--quiet', action='store_true', help='Suppress per-batch progress lines (per-file summaries are still printed)')
+    parser.add_argument('--parallel-tenants', type=int, default=0, help='Tenants loaded concurrently in multi-graph mode, one process each (default: min(8, tenants); 1 loads them one by one)')
+    parser.add_argument('--async-tenants', action='store_true', help='Run concurrent tenants on one event loop with threads sharing the connection pool instead of one process each')
+    parser.add_argument('--debug', action='store_true', help='Print sample records and generated queries for each file')
+    parser.add_argument('--bulk', action='store_true', help='Load new graphs with the binary GRAPH.BULK protocol (falls back to UNWIND if the graph exists; ignored with --merge-mode)')
+    parser.add_argument('--parse-workers', type=int, default=0, help='Number of processes parsing CSV files while a single connection writes the batches (default: 0, parse inline)')
+    parser.add_argument('--prefetch', action='store_true', help='Read the next CSV file into the page cache on a background thread while the current one is parsed')
+    parser.add_argument('--pipeline-depth', type=int, default=1, help='Send this many UNWIND batches per pipelined round trip, e.g. 8 (default: 1, one batch per request)')
+    parser.add_argument('--parallel-edges', type=int, default=0, metavar='K', help='Split each edge file into K bins by hash of the source id and load the bins concurrently; edges then ignore --parse-workers, --parse-threads and --loader-threads (default: off)')
+    parser.add_argument('--presort-edges', action='store_true', help='Externally sort each edge file by source (then target) id before loading it, using temporary files; edge files are then sorted and loaded one at a time (default: off)')
+    parser.add_argument('--parse-threads', type=int, default=0, help='Number of threads parsing CSV files ahead of a single submitting thread (default: 0, parse inline)')
+    parser.add_argument('--loader-threads', type=int, default=1, help='Number of threads loading CSV files concurrently over a shared connection pool (default: 1)')
     args = parser.parse_args()
     
     loader = FalkorDBCSVLoader(
         host=args.host,
         port=args.port,
+        unix_socket=args.unix_socket,
         graph_name=args.graph_name,
         csv_dir=args.csv_dir,
         username=args.username,
         password=args.password,
         merge_mode=args.merge_mode,
-        multi_graph_mode=args.multi_graph
+        assume_unique=args.assume_unique,
+        multi_graph_mode=args.multi_graph,
+        debug=args.debug,
+        quiet=args.quiet,
+        loader_threads=args.loader_threads,
+        parse_workers=args.parse_workers,
+        parse_threads=args.parse_threads,
+        prefetch=args.prefetch,
+        parallel_tenants=args.parallel_tenants,
+        async_tenants=args.async_tenants,
+        defer_indexes=args.defer_indexes,
+        pipeline_depth=args.pipeline_depth,
+        parallel_edges=args.parallel_edges,
+        presort_edges=args.presort_edges,
+        bulk_mode=args.bulk
     )
     
     try:
@@ -810,8 +1825,15 @@ Examples:
         loader.load_all_csvs(args.batch_size)
         
         if args.stats:
-            loader.get_graph_stats()
-            loader.verify_node_attributes("Person", 3)
+            # A multi-graph load leaves no graph selected, so report each tenant graph in turn
+            if loader.graph is not None:
+                graphs = [loader.graph]
+            else:
+                graphs = [loader.db.select_graph(graph_name) for graph_name in loader.tenant_graphs]
+            for graph in graphs:
+                loader.graph = graph
+                loader.get_graph_stats()
+                loader.verify_node_attributes("Person", 3)
             
     except KeyboardInterrupt:
         print("\n❌ Loading interrupted by user")
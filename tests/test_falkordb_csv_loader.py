@@ -0,0 +1,479 @@
+"""Unit tests for the pure helpers of falkordb_csv_loader.py
+
+Run from the repository root with: python -m unittest discover -s tests -b
+(-b keeps the loader's progress output out of the report)
+"""
+
+import contextlib
+import csv
+import io
+import math
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import falkordb_csv_loader as loader
+from falkordb import Graph
+
+
+def bare_loader(**attributes):
+    """A FalkorDBCSVLoader without a connection, with only the state the parsing helpers use"""
+    instance = loader.FalkorDBCSVLoader.__new__(loader.FalkorDBCSVLoader)
+    instance._batch_pool = loader.BatchPool(64)
+    instance.__dict__.update(attributes)
+    return instance
+
+
+class CsvFileTestCase(unittest.TestCase):
+    """Writes CSV files into a temporary directory"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_csv(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return path
+
+
+class IterCsvBatchesTest(CsvFileTestCase):
+    """iter_csv_batches yields the same typed columns with pyarrow, polars or the csv module"""
+
+    BACKENDS = ['stdlib'] + (['pyarrow'] if loader.pv is not None else []) + (['polars'] if loader.pl is not None else [])
+
+    @staticmethod
+    @contextlib.contextmanager
+    def backend(name):
+        """Hide the parser libraries other than the named one"""
+        pv = loader.pv if name == 'pyarrow' else None
+        pl = loader.pl if name == 'polars' else None
+        with mock.patch.object(loader, 'pv', pv), mock.patch.object(loader, 'pl', pl):
+            yield
+
+    def read(self, path, backend, batch_size=2, parser=None):
+        """Copy every batch, since the column lists are reused by the next one"""
+        parser = parser or bare_loader()
+        with self.backend(backend):
+            return [{name: list(column) for name, column in batch.items()} for batch in parser.iter_csv_batches(path, batch_size)]
+
+    def assert_backends_read(self, path, expected, batch_size=2):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend):
+                batches = self.read(path, backend, batch_size)
+                self.assertEqual(batches, expected)
+                for batch, expected_batch in zip(batches, expected):
+                    for name in expected_batch:
+                        self.assertEqual(list(map(type, batch[name])), list(map(type, expected_batch[name])))
+
+    def test_types_cells_like_the_csv_module(self):
+        path = self.write_csv('nodes_T.csv', (
+            'int,float,mixed,odd,text\n'
+            '1,1.5,1,0x10,NA\n'
+            '-2,.5,abc,+5,N/A\n'
+            ',-2.,2.5,1e5,null\n'
+            '12345678901234567890,,,nan,\n'
+        ))
+        self.assert_backends_read(path, [
+            {'int': [1, -2], 'float': [1.5, 0.5], 'mixed': [1, 'abc'], 'odd': ['0x10', '+5'], 'text': ['NA', 'N/A']},
+            {'int': [None, 12345678901234567890], 'float': [-2.0, None], 'mixed': [2.5, None], 'odd': ['1e5', 'nan'], 'text': ['null', None]},
+        ])
+        self.assert_backends_read(path, [{
+            'int': [1, -2, None, 12345678901234567890],
+            'float': [1.5, 0.5, -2.0, None],
+            'mixed': [1, 'abc', 2.5, None],
+            'odd': ['0x10', '+5', '1e5', 'nan'],
+            'text': ['NA', 'N/A', 'null', None],
+        }], batch_size=4)
+
+    def test_ragged_rows_are_padded_or_cut(self):
+        path = self.write_csv('nodes_R.csv', 'id,a,b\n1,2\n3,4,5\n6,7,8,9\n')
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend):
+                # Arrow loads the rows it skipped after the rest of the file, so compare them in id order
+                rows = [row for batch in self.read(path, backend) for row in zip(*batch.values())]
+                self.assertEqual(sorted(rows), [(1, 2, None), (3, 4, 5), (6, 7, 8)])
+
+    def test_pooled_columns_carry_nothing_across_files(self):
+        first = self.write_csv('nodes_A.csv', 'id,name,age\n1,a,30\n2,b,\n3,c,50\n4,d,60\n5,e,70\n')
+        second = self.write_csv('nodes_B.csv', 'id,city\n7,x\n8,y\n9,z\n')
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend):
+                parser = bare_loader()
+                self.assertEqual(self.read(first, backend, batch_size=3, parser=parser), [
+                    {'id': [1, 2, 3], 'name': ['a', 'b', 'c'], 'age': [30, None, 50]},
+                    {'id': [4, 5], 'name': ['d', 'e'], 'age': [60, 70]},
+                ])
+                # The second file gets the first file's buffers back, truncated by its last batch
+                pooled = set(map(id, parser._batch_pool._free))
+                with self.backend(backend):
+                    batches = parser.iter_csv_batches(second, 3)
+                    batch = next(batches)
+                    self.assertLessEqual(set(map(id, batch.values())), pooled)
+                    self.assertEqual(batch, {'id': [7, 8, 9], 'city': ['x', 'y', 'z']})
+                    batches.close()
+
+    def test_repeated_header_keeps_last_column(self):
+        # Same as csv.DictReader: the last 'name' wins and later columns keep their own values
+        path = self.write_csv('nodes_Person.csv', 'id,name,name,age\n1,a,b,30\n2,c,d,40\n')
+        self.assert_backends_read(path, [{'id': [1, 2], 'name': ['b', 'd'], 'age': [30, 40]}])
+
+
+class BatchParamsHeaderTest(unittest.TestCase):
+    """_batch_params_header must render exactly what graph.query(query, {'batch': rows}) sends"""
+
+    BATCHES = {
+        'empty': [],
+        'strings': [('alice', "O'Neil"), ('say "hi"', 'back\\slash'), ('', 'ünïcödé'), ('tab\there', 'new\nline')],
+        'nulls': [(None, None), (1, None), (None, 'x')],
+        'numbers': [(1, 2.5), (-3, -0.5), (0, 1.0), (12345678901234567890, 0.125)],
+        'mixed': [(1, 'a', None, 2.5), ('b', None, 3, 'c'), (None, 2, 'd', 4)],
+    }
+
+    def assert_matches_falkordb(self):
+        for name, batch in self.BATCHES.items():
+            with self.subTest(batch=name):
+                expected = Graph._build_params_header(Graph.__new__(Graph), {'batch': batch})
+                self.assertEqual(loader._batch_params_header(batch), expected)
+
+    @unittest.skipIf(loader.orjson is None, "orjson is not installed")
+    def test_matches_falkordb_with_orjson(self):
+        self.assert_matches_falkordb()
+
+    def test_matches_falkordb_without_orjson(self):
+        with mock.patch.object(loader, 'orjson', None):
+            self.assert_matches_falkordb()
+
+    def test_non_finite_floats_are_null_on_both_paths(self):
+        batch = [(math.nan, 1), (math.inf, -math.inf)]
+        expected = "CYPHER `batch`=[[null,1],[null,null]] "
+        with mock.patch.object(loader, 'orjson', None):
+            self.assertEqual(loader._batch_params_header(batch), expected)
+        if loader.orjson is not None:
+            self.assertEqual(loader._batch_params_header(batch), expected)
+
+
+class SortEdgesTest(CsvFileTestCase):
+    """--presort-edges: external merge sort of an edge file by (source, target)"""
+
+    def setUp(self):
+        super().setUp()
+        self.sort_dir = os.path.join(self.tmp.name, 'sorted')
+        self.loader = bare_loader()
+        # Spill a run every 7 rows so the merge sees several runs
+        patcher = mock.patch.object(loader, '_SORT_RUN_ROWS', 7)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_edges(self, rows):
+        text = io.StringIO()
+        csv.writer(text).writerows([['source', 'target', 'weight']] + rows)
+        return self.write_csv('edges_KNOWS.csv', text.getvalue())
+
+    @staticmethod
+    def read_rows(path):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return list(csv.reader(f))[1:]
+
+    @staticmethod
+    def sort_key(row):
+        return loader._edge_sort_key(row[0]), loader._edge_sort_key(row[1])
+
+    def test_matches_sorted(self):
+        rng = random.Random(7)
+        ids = ['-1', '0', '2', '10', 'a', 'x10']
+        # Duplicate (source, target) pairs check that the merge is stable like sorted()
+        rows = [[rng.choice(ids), rng.choice(ids), str(n)] for n in range(60)]
+        path = self.write_edges(rows)
+        sorted_path = self.loader._sort_edges(path, self.sort_dir)
+        self.assertNotEqual(sorted_path, path)
+        self.assertEqual(self.read_rows(sorted_path), sorted(rows, key=self.sort_key))
+        self.assertEqual(os.listdir(self.sort_dir), [os.path.basename(sorted_path)])
+
+    def test_merges_runs_in_bounded_passes(self):
+        rng = random.Random(11)
+        rows = [[str(rng.randrange(20)), str(rng.randrange(5)), str(n)] for n in range(100)]
+        path = self.write_edges(rows)
+        merged = []
+        merge = loader._merge_sorted_runs
+
+        def recording_merge(run_paths, *args, **kwargs):
+            merged.append(len(run_paths))
+            return merge(run_paths, *args, **kwargs)
+
+        # 15 spilled runs merged at most 3 at a time
+        with mock.patch.object(loader, '_SORT_MERGE_RUNS', 3), mock.patch.object(loader, '_merge_sorted_runs', recording_merge):
+            sorted_path = self.loader._sort_edges(path, self.sort_dir)
+        self.assertGreater(len(merged), 1)
+        self.assertLessEqual(max(merged), 3)
+        self.assertEqual(self.read_rows(sorted_path), sorted(rows, key=self.sort_key))
+        self.assertEqual(os.listdir(self.sort_dir), [os.path.basename(sorted_path)])
+
+    def test_numeric_ids_sort_as_numbers(self):
+        path = self.write_edges([['10', '1', 'a'], ['9', '2', 'b'], ['x', '1', 'c'], ['-1', '3', 'd']])
+        sorted_path = self.loader._sort_edges(path, self.sort_dir)
+        self.assertEqual([row[2] for row in self.read_rows(sorted_path)], ['d', 'b', 'a', 'c'])
+
+    def test_already_sorted_file_is_returned_as_is(self):
+        rows = [[str(n // 3), str(n % 3), str(n)] for n in range(30)]
+        path = self.write_edges(rows)
+        self.assertEqual(self.loader._sort_edges(path, self.sort_dir), path)
+        self.assertEqual(os.listdir(self.sort_dir), [])
+
+
+class BulkPackTest(unittest.TestCase):
+    """GRAPH.BULK binary encodings"""
+
+    def test_header(self):
+        self.assertEqual(loader._pack_bulk_header('Person', ['name', 'age']), b'Person\x00' + struct.pack('=I', 2) + b'name\x00age\x00')
+        self.assertEqual(loader._pack_bulk_header('KNOWS', []), b'KNOWS\x00' + struct.pack('=I', 0))
+
+    def test_values(self):
+        self.assertEqual(loader._pack_bulk_value(None), b'\x00')
+        self.assertEqual(loader._pack_bulk_value(True), b'\x01\x01')
+        self.assertEqual(loader._pack_bulk_value(False), b'\x01\x00')
+        self.assertEqual(loader._pack_bulk_value(2.5), b'\x02' + struct.pack('=d', 2.5))
+        self.assertEqual(loader._pack_bulk_value('hé'), b'\x03h\xc3\xa9\x00')
+        self.assertEqual(loader._pack_bulk_value(-7), b'\x04' + struct.pack('=q', -7))
+
+
+class CoerceColumnTest(unittest.TestCase):
+    """_coerce_column types every cell exactly as _coerce would"""
+
+    COLUMNS = [
+        ['1', '-2', '', '30'],
+        ['1.5', '.5', '-2.', ''],
+        ['1', '2.5', '', '-3'],
+        ['alice', '', 'bob'],
+        ['1', 'abc', '2.5', ''],
+        ['0x10', '+5', '1e5', 'nan', 'inf', 'Infinity', ' 1', 'NA'],
+        ['1', 'two\nlines', '3'],
+        ['12345678901234567890', '1'],
+        ['', ''],
+        [],
+    ]
+
+    def test_matches_per_cell_coercion(self):
+        for values in self.COLUMNS:
+            with self.subTest(values=values):
+                typed = loader._coerce_column(values)
+                expected = [loader._coerce(value) for value in values]
+                self.assertEqual(typed, expected)
+                self.assertEqual(list(map(type, typed)), list(map(type, expected)))
+
+    def test_types(self):
+        self.assertEqual(loader._coerce_column(['1', '', '-3']), [1, None, -3])
+        self.assertEqual(loader._coerce_column(['1', '2.5']), [1, 2.5])
+        self.assertEqual(loader._coerce_column(['0x10', '+5', 'nan']), ['0x10', '+5', 'nan'])
+
+
+class BatchPoolTest(unittest.TestCase):
+
+    def test_reuses_returned_columns(self):
+        pool = loader.BatchPool(limit=4)
+        columns = pool.get(2, 3)
+        self.assertEqual(columns, [[None] * 3, [None] * 3])
+        pool.put(columns)
+        reused = pool.get(2, 3)
+        self.assertCountEqual(map(id, reused), map(id, columns))
+
+    def test_resizes_reused_columns(self):
+        pool = loader.BatchPool(limit=4)
+        pool.put([[1, 2], [1, 2, 3, 4, 5]])
+        shorter, longer = pool.get(2, 3)
+        self.assertEqual(shorter, [1, 2, 3])
+        self.assertEqual(longer, [1, 2, None])
+
+    def test_keeps_at_most_limit_columns(self):
+        pool = loader.BatchPool(limit=2)
+        returned = [[None], [None], [None]]
+        pool.put(returned)
+        reused = pool.get(3, 1)
+        self.assertEqual(sum(any(column is kept for kept in returned) for column in reused), 2)
+
+
+class CypherBuilderTest(unittest.TestCase):
+    """UNWIND queries over positional rows: [id, properties...] for nodes, [source, target, properties...] for edges"""
+
+    def test_create_nodes(self):
+        self.assertEqual(
+            loader._build_node_cypher('Person', ('name', 'age'), False),
+            "UNWIND $batch AS row CREATE (n:Person) SET n.`id` = row[0], n.`name` = row[1], n.`age` = row[2]",
+        )
+        self.assertEqual(loader._build_node_cypher('Person', (), False), "UNWIND $batch AS row CREATE (n:Person) SET n.`id` = row[0]")
+
+    def test_merge_nodes_keeps_existing_values_for_null_cells(self):
+        self.assertEqual(
+            loader._build_node_cypher('Person', ('name',), True),
+            "UNWIND $batch AS row MERGE (n:Person {id: row[0]}) SET n.`name` = coalesce(row[1], n.`name`)",
+        )
+        self.assertEqual(loader._build_node_cypher('Person', (), True), "UNWIND $batch AS row MERGE (n:Person {id: row[0]})")
+
+    def test_create_edges(self):
+        self.assertEqual(
+            loader._build_edge_cypher('KNOWS', 'Person', 'City', ('since',), False),
+            "UNWIND $batch AS row MATCH (a:Person {id: row[0]}) MATCH (b:City {id: row[1]}) "
+            "CREATE (a)-[r:KNOWS]->(b) SET r.`since` = row[2]",
+        )
+        # Without both endpoint labels the endpoints are matched by id alone
+        self.assertEqual(
+            loader._build_edge_cypher('KNOWS', 'Person', '', (), False),
+            "UNWIND $batch AS row MATCH (a {id: row[0]}) MATCH (b {id: row[1]}) CREATE (a)-[r:KNOWS]->(b)",
+        )
+
+    def test_merge_edges(self):
+        self.assertEqual(
+            loader._build_edge_cypher('KNOWS', 'Person', 'City', ('since', 'weight'), True),
+            "UNWIND $batch AS row MERGE (a:Person {id: row[0]}) MERGE (b:City {id: row[1]}) MERGE (a)-[r:KNOWS]->(b) "
+            "SET r.`since` = coalesce(row[2], r.`since`), r.`weight` = coalesce(row[3], r.`weight`)",
+        )
+
+
+class PrepareEdgeBatchesTest(CsvFileTestCase):
+    """Edge batches: one UNWIND query per endpoint label pair, rows sorted by source id"""
+
+    def prepare(self, text, batch_size=10):
+        path = self.write_csv('edges_KNOWS.csv', text)
+        return list(bare_loader(debug=False, merge_mode=False).prepare_edge_batches(path, batch_size))
+
+    def test_splits_batches_by_label_pair(self):
+        batches = self.prepare(
+            'source,target,source_label,target_label,since\n'
+            '3,1,Person,City,2001\n'
+            '2,9,Person:Admin,Person,2002\n'
+            '1,2,Person,City,\n'
+            ',4,Person,City,2004\n'
+            '5,,Person,Person,2005\n'
+        )
+        self.assertEqual(batches, [
+            (loader._build_edge_cypher('KNOWS', 'Person', 'City', ('since',), False), [(1, 2, None), (3, 1, 2001)]),
+            (loader._build_edge_cypher('KNOWS', 'Person', 'Person', ('since',), False), [(2, 9, 2002)]),
+        ])
+
+    def test_single_label_pair_fast_path(self):
+        # One label pair and no missing endpoints: rows are zipped straight from the columns
+        text = 'source,target,source_label,target_label,since\n3,1,Person:Admin,City,2001\n1,2,Person:Admin,City,\n'
+        with mock.patch.object(loader, '_first_label', wraps=loader._first_label) as first_label:
+            batches = self.prepare(text)
+        self.assertEqual(batches, [
+            (loader._build_edge_cypher('KNOWS', 'Person', 'City', ('since',), False), [(1, 2, None), (3, 1, 2001)]),
+        ])
+        # Labels are parsed once per batch, not once per row
+        self.assertEqual(first_label.call_count, 2)
+
+    def test_fast_path_sorts_each_batch_by_source(self):
+        rows = [(n % 7, n, n) for n in range(20)]
+        batches = self.prepare('source,target,source_label,target_label,w\n' + ''.join(f'{s},{t},A,B,{w}\n' for s, t, w in rows), batch_size=8)
+        query = loader._build_edge_cypher('KNOWS', 'A', 'B', ('w',), False)
+        self.assertEqual(batches, [(query, sorted(rows[k:k + 8], key=lambda row: row[0])) for k in range(0, 20, 8)])
+
+
+class CsvHasRowsTest(CsvFileTestCase):
+    """Discovery skips CSV files with no rows past the header"""
+
+    def entry(self, text):
+        path = self.write_csv('nodes_X.csv', text)
+        with os.scandir(self.tmp.name) as entries:
+            entry, = [entry for entry in entries if entry.path == path]
+        return entry
+
+    def has_rows(self, text):
+        return loader._csv_has_rows(self.entry(text))
+
+    def test_empty_and_header_only_files(self):
+        self.assertFalse(self.has_rows(''))
+        self.assertFalse(self.has_rows('id,name'))
+        self.assertFalse(self.has_rows('id,name\n'))
+        self.assertFalse(self.has_rows('id,name\r\n\r\n\n'))
+
+    def test_small_file_with_a_row(self):
+        self.assertTrue(self.has_rows('id,name\n1,a'))
+        self.assertTrue(self.has_rows('id,name\r\n1,a\r\n'))
+
+    def test_large_files_are_not_read(self):
+        header = ','.join(f'column_{k}' for k in range(40)) + '\n'
+        self.assertGreater(len(header), loader._SMALL_CSV_BYTES)
+        entry = self.entry(header)
+        with mock.patch('builtins.open', side_effect=AssertionError('file was read')):
+            # Only the size is checked, so even a long header-only file counts as having rows
+            self.assertTrue(loader._csv_has_rows(entry))
+
+
+class BalancedPartitionsTest(CsvFileTestCase):
+    """Files are dealt to workers by size, keeping each group on one worker"""
+
+    def sized(self, name, size):
+        return self.write_csv(name, 'x' * size)
+
+    def test_largest_first_to_the_lightest_partition(self):
+        big, medium, small, tiny = (self.sized(f'nodes_{k}.csv', size) for k, size in enumerate((900, 500, 400, 100)))
+        partitions = loader.FalkorDBCSVLoader._balanced_partitions([[tiny], [medium], [big], [small]], 2)
+        self.assertEqual(partitions, [[big, tiny], [medium, small]])
+
+    def test_groups_stay_together(self):
+        a1, a2, b, c = (self.sized(f'edges_{k}.csv', size) for k, size in enumerate((300, 300, 500, 100)))
+        partitions = loader.FalkorDBCSVLoader._balanced_partitions([[a1, a2], [b], [c]], 2)
+        self.assertEqual(partitions, [[a1, a2], [b, c]])
+
+    def test_ties_spread_over_workers(self):
+        # Empty (or missing) files all weigh nothing; they are spread by file count
+        paths = [self.sized(f'nodes_{k}.csv', 0) for k in range(4)] + [os.path.join(self.tmp.name, 'missing.csv')]
+        partitions = loader.FalkorDBCSVLoader._balanced_partitions([[path] for path in paths], 3)
+        self.assertEqual(sorted(map(len, partitions)), [1, 2, 2])
+        self.assertCountEqual([path for partition in partitions for path in partition], paths)
+
+
+class LoadParsedTest(unittest.TestCase):
+    """The single writer of --parse-workers / --parse-threads ends every file and never waits on a dead worker"""
+
+    def setUp(self):
+        patcher = mock.patch.object(loader, '_PARSE_POLL_SECONDS', 0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self, prepare, partitions, **attributes):
+        """Run _load_parsed with prepare(path, batch_size) as the parser; returns (submitted batches, output)"""
+        parser = bare_loader(**{'prefetch': False, 'parse_workers': 0, 'fake_prepare': prepare, **attributes})
+        submitted = []
+        parser._submit_batch = lambda query, rows, entity, source, loaded, progress: (
+            submitted.append((source, query, rows)), loaded.__setitem__(source, loaded.get(source, 0) + len(rows)))
+        parser._flush_batches = lambda: None
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            parser._load_parsed(partitions, 'fake_prepare', 'node', 10)
+        return submitted, output.getvalue()
+
+    def test_parse_error_ends_the_file_and_the_worker_moves_on(self):
+        def prepare(path, batch_size):
+            yield 'Q', [(path, 1)]
+            if path == 'bad.csv':
+                raise ValueError('boom')
+
+        submitted, output = self.load(prepare, [['bad.csv', 'next.csv'], ['good.csv']])
+        self.assertCountEqual(submitted, [(path, 'Q', [(path, 1)]) for path in ('bad.csv', 'next.csv', 'good.csv')])
+        self.assertIn('Parsing bad.csv failed after 1 nodes: boom', output)
+        self.assertIn('Loaded 1 nodes from next.csv', output)
+        self.assertIn('Loaded 1 nodes from good.csv', output)
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork', "needs fork to hand the fake parser to workers")
+    def test_killed_worker_does_not_hang_the_writer(self):
+        def prepare(path, batch_size):
+            if path == 'dead.csv':
+                os._exit(9)
+            yield 'Q', [(path, 1)]
+
+        submitted, output = self.load(prepare, [['good.csv'], ['dead.csv']], parse_workers=2)
+        self.assertEqual(submitted, [('good.csv', 'Q', [('good.csv', 1)])])
+        self.assertIn('Parse worker 1 died (exit code 9)', output)
+
+
+if __name__ == '__main__':
+    unittest.main()